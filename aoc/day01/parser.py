@@ -1,3 +1,10 @@
+from array import array
+from typing import Iterable, Iterator
+
+# Characters of input converted per step by parse_rotations_array
+_ARRAY_CHUNK = 1 << 16
+
+
 def parse_rotations(input_text: str) -> list[tuple[str, int]]:
     """Parse input into list of (direction, distance) tuples.
 
@@ -15,3 +22,60 @@ def parse_rotations(input_text: str) -> list[tuple[str, int]]:
             distance = int(line[1:])
             rotations.append((direction, distance))
     return rotations
+
+
+def parse_rotations_array(input_text: str) -> array:
+    """Parse input into a compact array of signed distances.
+
+    Uses 8 bytes per rotation instead of a tuple and string per line.
+    The text is converted in newline-aligned chunks, so apart from the
+    array only one chunk's worth of temporary strings exists at a time.
+    Both day 1 solvers accept this representation directly.
+
+    Args:
+        input_text: Raw input text with one rotation per line (e.g., "L68", "R48")
+
+    Returns:
+        array('q') of distances, negative for L (e.g., array('q', [-68, 48]))
+    """
+    rotations = array("q")
+    pos, size = 0, len(input_text)
+    while pos < size:
+        cut = input_text.rfind("\n", pos, pos + _ARRAY_CHUNK) if pos + _ARRAY_CHUNK < size else size
+        if cut <= pos:  # No newline within the chunk: take the whole line
+            cut = input_text.find("\n", pos + _ARRAY_CHUNK)
+            if cut == -1:
+                cut = size
+        chunk = input_text[pos:cut].replace("R", "").replace("L", "-")
+        rotations.extend(map(int, chunk.split()))
+        pos = cut + 1
+    return rotations
+
+
+def iter_rotations(source: Iterable[str | bytes]) -> Iterator[tuple[str, int]]:
+    """Lazily parse rotations from a file object or iterator of chunks.
+
+    Accepts the same text format as parse_rotations. Chunks may be lines
+    (as from iterating a text or binary file) or arbitrary pieces of the
+    input; only the unfinished last line is buffered between chunks.
+
+    Args:
+        source: Iterable of str or bytes chunks
+
+    Yields:
+        (direction, distance) tuples like ('L', 68)
+    """
+    pending = ""
+    for chunk in source:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode()
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line[0], int(line[1:])
+
+    pending = pending.strip()
+    if pending:
+        yield pending[0], int(pending[1:])
@@ -1,4 +1,21 @@
-def solve_part1(rotations: list[tuple[str, int]]) -> int:
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import accumulate
+from typing import Iterable, Sequence
+
+from aoc.day01.parser import iter_rotations
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; a pure-Python fallback is used
+    np = None
+
+
+def solve_part1(
+    rotations: list[tuple[str, int]] | array, start: int = 50, modulus: int = 100
+) -> int:
     """Solve part 1: count how many times the dial lands on 0.
 
     The dial has numbers 0-99 arranged in a circle, starting at 50.
@@ -6,19 +23,29 @@ def solve_part1(rotations: list[tuple[str, int]]) -> int:
     The dial wraps around (0-1=99, 99+1=0).
 
     Args:
-        rotations: List of (direction, distance) tuples
+        rotations: List of (direction, distance) tuples, or an array of
+                   signed distances from parse_rotations_array
+        start: Starting dial position (default 50)
+        modulus: Number of positions on the dial (default 100)
 
     Returns:
         Number of times the dial points at 0 after a rotation
     """
-    position = 50
+    position = start
     zero_count = 0
 
+    if isinstance(rotations, array):
+        for distance in rotations:
+            position = (position + distance) % modulus
+            if position == 0:
+                zero_count += 1
+        return zero_count
+
     for direction, distance in rotations:
         if direction == "L":
-            position = (position - distance) % 100
+            position = (position - distance) % modulus
         else:  # R
-            position = (position + distance) % 100
+            position = (position + distance) % modulus
 
         if position == 0:
             zero_count += 1
@@ -26,33 +53,461 @@ def solve_part1(rotations: list[tuple[str, int]]) -> int:
     return zero_count
 
 
-def solve_part2(rotations: list[tuple[str, int]]) -> int:
+def solve_part2(
+    rotations: list[tuple[str, int]] | array, start: int = 50, modulus: int = 100
+) -> int:
     """Solve part 2: count every time the dial passes through or lands on 0.
 
     Unlike part 1, this counts every click that lands on 0, not just
     the final position after each rotation.
 
     Args:
-        rotations: List of (direction, distance) tuples
+        rotations: List of (direction, distance) tuples, or an array of
+                   signed distances from parse_rotations_array
+        start: Starting dial position (default 50)
+        modulus: Number of positions on the dial (default 100)
 
     Returns:
         Total number of times the dial points at 0 during all rotations
     """
-    position = 50
+    position = start
     zero_count = 0
 
+    if isinstance(rotations, array):
+        for distance in rotations:
+            if distance >= 0:
+                zero_count += (position + distance) // modulus
+            else:
+                # Left by D from p > 0 hits 0 (D - p) // modulus + 1 times,
+                # which is (D - p + modulus) // modulus; from 0 it is one less
+                zero_count += (modulus - position - distance) // modulus - (position == 0)
+            position = (position + distance) % modulus
+        return zero_count
+
     for direction, distance in rotations:
         if direction == "R":
             # Moving right: we hit 0 every time we wrap from 99 to 0
-            zero_count += (position + distance) // 100
-            position = (position + distance) % 100
+            zero_count += (position + distance) // modulus
+            position = (position + distance) % modulus
         else:  # L
             # Moving left: we hit 0 every time we wrap from 0 to 99
             if position == 0:
-                zero_count += distance // 100
+                zero_count += distance // modulus
             elif position <= distance:
-                zero_count += (distance - position) // 100 + 1
+                zero_count += (distance - position) // modulus + 1
             # else: position > distance, we never cross 0
-            position = (position - distance) % 100
+            position = (position - distance) % modulus
 
     return zero_count
+
+
+def signed_distances(rotations: list[tuple[str, int]]) -> list[int]:
+    """Convert (direction, distance) tuples to signed distances.
+
+    Args:
+        rotations: List of (direction, distance) tuples
+
+    Returns:
+        List of distances, negative for L rotations
+    """
+    return [-distance if direction == "L" else distance for direction, distance in rotations]
+
+
+def solve_vectorised(distances) -> tuple[int, int]:
+    """Solve both parts from signed distances without a per-rotation branch.
+
+    Works on the unwrapped dial position, 50 plus the running sum of
+    signed distances. A rotation from a to b lands on 0 when b % 100 == 0.
+    A right move passes 0 once per multiple of 100 in (a, b], i.e.
+    b // 100 - a // 100 times. A left move passes 0 once per multiple of
+    100 in [b, a), i.e. (a - 1) // 100 - (b - 1) // 100 times, which also
+    reproduces the left-from-0 behaviour of solve_part2. Both cases are
+    |(b - s) // 100 - (a - s) // 100| with s = 1 for left moves.
+
+    Uses NumPy when available, otherwise the same arithmetic over
+    itertools.accumulate.
+
+    Args:
+        distances: Sequence of signed distances (see signed_distances)
+
+    Returns:
+        Tuple of (part 1 answer, part 2 answer)
+    """
+    if np is not None:
+        signed = np.asarray(distances, dtype=np.int64)
+        positions = 50 + np.cumsum(signed)
+        previous = np.concatenate(([50], positions[:-1]))
+        shift = (signed < 0).astype(np.int64)
+        part1 = int(np.count_nonzero(positions % 100 == 0))
+        part2 = int(np.abs((positions - shift) // 100 - (previous - shift) // 100).sum())
+        return part1, part2
+
+    positions = list(accumulate(distances, initial=50))
+    part1 = sum(1 for position in positions[1:] if position % 100 == 0)
+    part2 = sum(
+        abs((b - (d < 0)) // 100 - (a - (d < 0)) // 100)
+        for a, b, d in zip(positions, positions[1:], distances)
+    )
+    return part1, part2
+
+
+def solve_stream(source: Iterable[str | bytes]) -> tuple[int, int]:
+    """Parse and solve both parts in one pass with constant memory.
+
+    Rotations are read lazily from a file object or chunk iterator (see
+    iter_rotations), so no list of rotations is ever built.
+
+    Args:
+        source: Iterable of str or bytes chunks in the parse_rotations format
+
+    Returns:
+        Tuple of (part 1 answer, part 2 answer)
+    """
+    position = 50
+    landings = 0
+    crossings = 0
+
+    for direction, distance in iter_rotations(source):
+        if direction == "R":
+            crossings += (position + distance) // 100
+            position = (position + distance) % 100
+        else:  # L
+            if position == 0:
+                crossings += distance // 100
+            elif position <= distance:
+                crossings += (distance - position) // 100 + 1
+            position = (position - distance) % 100
+
+        if position == 0:
+            landings += 1
+
+    return landings, crossings
+
+
+class DialSegment:
+    """Summary of a run of rotations for every possible start position.
+
+    For each start position p, holds the end position and the number of
+    zero landings (part 1) and zero crossings (part 2) the run produces.
+    Summaries of consecutive runs combine associatively, so a long log
+    can be split into chunks, summarised independently and merged.
+    """
+
+    __slots__ = ("modulus", "end", "landings", "crossings")
+
+    def __init__(self, modulus: int, end: list[int], landings: list[int], crossings: list[int]):
+        """Create a summary from per-start-position tables.
+
+        Args:
+            modulus: Number of positions on the dial.
+            end: end[p] is the final position when starting at p.
+            landings: landings[p] is the part 1 count when starting at p.
+            crossings: crossings[p] is the part 2 count when starting at p.
+        """
+        self.modulus = modulus
+        self.end = end
+        self.landings = landings
+        self.crossings = crossings
+
+    @classmethod
+    def identity(cls, modulus: int = 100) -> "DialSegment":
+        """Summary of an empty run of rotations."""
+        return cls(modulus, list(range(modulus)), [0] * modulus, [0] * modulus)
+
+    @classmethod
+    def from_distances(cls, distances: Iterable[int], modulus: int = 100) -> "DialSegment":
+        """Summarise signed distances in O(len(distances) + modulus).
+
+        A single rotation by d = q * modulus + r (0 <= r < modulus) from
+        position x crosses 0 exactly q times, plus once more when
+        x >= modulus - r for right moves or 1 <= x <= r for left moves.
+        Since x is the start position shifted by the running offset, each
+        extra crossing adds 1 over a cyclic interval of start positions,
+        accumulated in a difference array. Landings after rotation i
+        happen for the single start position congruent to -offset.
+
+        Args:
+            distances: Signed distances, negative for L rotations.
+            modulus: Number of positions on the dial.
+
+        Returns:
+            The summary of the whole run.
+        """
+        offset = 0
+        base_crossings = 0
+        diff = [0] * (modulus + 1)
+        landings = [0] * modulus
+
+        for d in distances:
+            q, r = divmod(abs(d), modulus)
+            base_crossings += q
+            if r:
+                # Extra crossing for dial positions lo..hi before the move
+                lo, hi = (modulus - r, modulus - 1) if d > 0 else (1, r)
+                first = (lo - offset) % modulus
+                last = first + hi - lo + 1
+                if last <= modulus:
+                    diff[first] += 1
+                    diff[last] -= 1
+                else:
+                    diff[first] += 1
+                    diff[modulus] -= 1
+                    diff[0] += 1
+                    diff[last - modulus] -= 1
+            offset += d
+            landings[-offset % modulus] += 1
+
+        crossings = list(accumulate(diff[:modulus]))
+        if base_crossings:
+            crossings = [c + base_crossings for c in crossings]
+        shift = offset % modulus
+        end = [(p + shift) % modulus for p in range(modulus)]
+        return cls(modulus, end, landings, crossings)
+
+    @classmethod
+    def from_rotations(cls, rotations: list[tuple[str, int]], modulus: int = 100) -> "DialSegment":
+        """Summarise (direction, distance) tuples."""
+        return cls.from_distances(signed_distances(rotations), modulus)
+
+    def combine(self, other: "DialSegment") -> "DialSegment":
+        """Summary of this run followed by other, in O(modulus)."""
+        end = [other.end[e] for e in self.end]
+        landings = [a + other.landings[e] for a, e in zip(self.landings, self.end)]
+        crossings = [a + other.crossings[e] for a, e in zip(self.crossings, self.end)]
+        return DialSegment(self.modulus, end, landings, crossings)
+
+    def answers(self, start: int = 50) -> tuple[int, int]:
+        """Return (part 1, part 2) answers for a given start position."""
+        return self.landings[start], self.crossings[start]
+
+
+def solve_parallel(
+    rotations: Sequence[tuple[str, int]],
+    chunk_size: int = 100_000,
+    processes: int | None = None,
+) -> tuple[int, int]:
+    """Solve both parts by summarising chunks in worker processes.
+
+    Args:
+        rotations: List of (direction, distance) tuples
+        chunk_size: Rotations per chunk
+        processes: Number of worker processes (default: CPU count)
+
+    Returns:
+        Tuple of (part 1 answer, part 2 answer)
+    """
+    chunks = [rotations[i:i + chunk_size] for i in range(0, len(rotations), chunk_size)]
+    with ProcessPoolExecutor(processes) as executor:
+        summaries = executor.map(DialSegment.from_rotations, chunks)
+        total = reduce(DialSegment.combine, summaries, DialSegment.identity())
+    return total.answers()
+
+
+def solve_all_starts(
+    rotations: list[tuple[str, int]], modulus: int = 100
+) -> tuple[list[int], list[int]]:
+    """Solve both parts for every start position in one pass.
+
+    Equivalent to calling solve_part1 and solve_part2 once per start
+    position, but costs O(len(rotations) + modulus) in total (see
+    DialSegment.from_distances).
+
+    Args:
+        rotations: List of (direction, distance) tuples
+        modulus: Number of positions on the dial
+
+    Returns:
+        Tuple of (part 1 counts, part 2 counts), each indexed by start position
+    """
+    segment = DialSegment.from_rotations(rotations, modulus)
+    return segment.landings, segment.crossings
+
+
+class _DialNode:
+    """Node of DialLog's tree: one rotation plus the summary of its subtree."""
+
+    __slots__ = ("distance", "priority", "size", "left", "right", "summary")
+
+    def __init__(self, distance: int, priority: float):
+        self.distance = distance
+        self.priority = priority
+        self.size = 1
+        self.left = None
+        self.right = None
+        self.summary = None
+
+
+class DialLog:
+    """Editable rotation log with O(log n) re-query.
+
+    Rotations are kept in a balanced binary tree ordered by log position
+    (a treap with implicit keys), where every node stores the DialSegment
+    of its whole subtree. Point updates and inserts rebuild the summaries
+    on one root-to-leaf path, and any sub-range of the log is answered by
+    combining O(log n) stored summaries, each combine costing O(modulus).
+
+    Every node holds three tables of `modulus` entries, so memory use is
+    O(n * modulus).
+    """
+
+    def __init__(self, rotations: Iterable[tuple[str, int]] = (), modulus: int = 100):
+        """Build the log from (direction, distance) tuples in O(n * modulus).
+
+        Args:
+            rotations: Initial rotations, in order.
+            modulus: Number of positions on the dial.
+        """
+        self.modulus = modulus
+        self._identity = DialSegment.identity(modulus)
+        self._root = self._build([
+            _DialNode(distance, random.random())
+            for distance in signed_distances(list(rotations))
+        ])
+
+    def _build(self, nodes: list[_DialNode]) -> _DialNode | None:
+        """Build a treap from nodes in log order using a stack (Cartesian tree)."""
+        stack = []
+        for node in nodes:
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+
+        # Fill in sizes and summaries bottom-up (children before parents)
+        order = []
+        pending = stack[:1]
+        while pending:
+            node = pending.pop()
+            order.append(node)
+            pending.extend(child for child in (node.left, node.right) if child)
+        for node in reversed(order):
+            self._pull(node)
+        return stack[0] if stack else None
+
+    def _pull(self, node: _DialNode) -> None:
+        """Recompute a node's size and summary from its children."""
+        summary = DialSegment.from_distances((node.distance,), self.modulus)
+        size = 1
+        if node.left:
+            summary = node.left.summary.combine(summary)
+            size += node.left.size
+        if node.right:
+            summary = summary.combine(node.right.summary)
+            size += node.right.size
+        node.size = size
+        node.summary = summary
+
+    def _split(self, node: _DialNode | None, count: int) -> tuple:
+        """Split a subtree into its first `count` rotations and the rest."""
+        if node is None:
+            return None, None
+        left_size = node.left.size if node.left else 0
+        if count <= left_size:
+            first, node.left = self._split(node.left, count)
+            self._pull(node)
+            return first, node
+        node.right, rest = self._split(node.right, count - left_size - 1)
+        self._pull(node)
+        return node, rest
+
+    def _merge(self, first: _DialNode | None, second: _DialNode | None) -> _DialNode | None:
+        """Concatenate two subtrees."""
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if first.priority > second.priority:
+            first.right = self._merge(first.right, second)
+            self._pull(first)
+            return first
+        second.left = self._merge(first, second.left)
+        self._pull(second)
+        return second
+
+    def __len__(self) -> int:
+        return self._root.size if self._root else 0
+
+    def _check_index(self, index: int, size: int) -> int:
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("DialLog index out of range")
+        return index
+
+    def update(self, index: int, direction: str, distance: int) -> None:
+        """Replace the rotation at index in O(log n * modulus)."""
+        index = self._check_index(index, len(self))
+        path = []
+        node = self._root
+        while True:
+            path.append(node)
+            left_size = node.left.size if node.left else 0
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                break
+            else:
+                index -= left_size + 1
+                node = node.right
+        node.distance = -distance if direction == "L" else distance
+        for node in reversed(path):
+            self._pull(node)
+
+    def insert(self, index: int, direction: str, distance: int) -> None:
+        """Insert a rotation before index in expected O(log n * modulus)."""
+        index = max(0, min(index, len(self)))
+        node = _DialNode(-distance if direction == "L" else distance, random.random())
+        self._pull(node)
+        first, rest = self._split(self._root, index)
+        self._root = self._merge(self._merge(first, node), rest)
+
+    def append(self, direction: str, distance: int) -> None:
+        """Add a rotation at the end of the log."""
+        self.insert(len(self), direction, distance)
+
+    def delete(self, index: int) -> None:
+        """Remove the rotation at index in expected O(log n * modulus)."""
+        index = self._check_index(index, len(self))
+        first, rest = self._split(self._root, index)
+        _, rest = self._split(rest, 1)
+        self._root = self._merge(first, rest)
+
+    def _query(self, node: _DialNode | None, start: int, stop: int) -> DialSegment:
+        """Summary of rotations [start, stop) within a subtree."""
+        if node is None or start >= stop:
+            return self._identity
+        if start <= 0 and stop >= node.size:
+            return node.summary
+        left_size = node.left.size if node.left else 0
+        summary = self._identity
+        if start < left_size:
+            summary = self._query(node.left, start, min(stop, left_size))
+        if start <= left_size < stop:
+            summary = summary.combine(DialSegment.from_distances((node.distance,), self.modulus))
+        if stop > left_size + 1:
+            summary = summary.combine(
+                self._query(node.right, max(start - left_size - 1, 0), stop - left_size - 1)
+            )
+        return summary
+
+    def summary(self, start: int = 0, stop: int | None = None) -> DialSegment:
+        """DialSegment of rotations [start, stop), in O(log n * modulus)."""
+        size = len(self)
+        stop = size if stop is None else min(stop, size)
+        return self._query(self._root, max(start, 0), stop)
+
+    def answers(self, start: int = 0, stop: int | None = None, dial_start: int = 50) -> tuple[int, int]:
+        """Part 1 and part 2 answers for rotations [start, stop).
+
+        Args:
+            start: First rotation of the sub-range (inclusive).
+            stop: End of the sub-range (exclusive, default: end of log).
+            dial_start: Dial position before the first rotation of the range.
+
+        Returns:
+            Tuple of (part 1 answer, part 2 answer)
+        """
+        return self.summary(start, stop).answers(dial_start)
@@ -1,3 +1,13 @@
+from bisect import bisect_right
+from functools import lru_cache
+from heapq import merge
+from sys import maxsize
+from typing import Container, Iterator
+from operator import add
+
+from aoc.utils.map_reduce import MapReduceJob
+
+
 def is_invalid_id(n: int) -> bool:
     """Check if a number is an invalid ID (digits repeated twice).
 
@@ -73,7 +83,9 @@ def find_invalid_sum_in_range_optimized(start: int, end: int) -> int:
     OPTIMIZATION: Instead of iterating over each base, we use the formula:
         sum(base * m for base in range(a, b+1)) = m * (b - a + 1) * (a + b) / 2
 
-    This is O(log(max_digits)) instead of O(number of invalid IDs).
+    This is O(log(max_digits)) instead of O(number of invalid IDs). The
+    multipliers come from the memoised tables of the generalised engine
+    (find_repeated_sum_in_range with EXACTLY_TWICE).
 
     Args:
         start: Start of range (inclusive)
@@ -82,33 +94,7 @@ def find_invalid_sum_in_range_optimized(start: int, end: int) -> int:
     Returns:
         Sum of all invalid IDs in the range
     """
-    total = 0
-    k = 1
-
-    while True:
-        multiplier = 10**k + 1
-
-        # Valid k-digit bases
-        min_base = 1 if k == 1 else 10 ** (k - 1)
-        max_base = 10**k - 1
-
-        # Early exit if smallest possible number exceeds range
-        if min_base * multiplier > end:
-            break
-
-        # Find bases producing numbers in [start, end]
-        base_min = max(min_base, -(-start // multiplier))  # ceil division
-        base_max = min(max_base, end // multiplier)
-
-        if base_min <= base_max:
-            # Arithmetic series: sum of base_min to base_max
-            count = base_max - base_min + 1
-            sum_of_bases = count * (base_min + base_max) // 2
-            total += multiplier * sum_of_bases
-
-        k += 1
-
-    return total
+    return find_repeated_sum_in_range(start, end, EXACTLY_TWICE)
 
 
 def solve_part1(ranges: list[tuple[int, int]]) -> int:
@@ -128,6 +114,20 @@ def solve_part1(ranges: list[tuple[int, int]]) -> int:
     return total
 
 
+def _split_ranges(ranges: list[tuple[int, int]]) -> tuple[list[tuple[int, int]], None]:
+    """Map-reduce splitter: every range is an independent record."""
+    return ranges, None
+
+
+def _range_invalid_sum(record: tuple[int, int], context: None) -> int:
+    """Map-reduce kernel: sum of invalid IDs in one range."""
+    return find_invalid_sum_in_range_optimized(*record)
+
+
+# Part 1 as a map-reduce job over ranges, for aoc.utils.map_reduce
+PART1_JOB = MapReduceJob(_split_ranges, _range_invalid_sum, add)
+
+
 def is_invalid_id_part2(n: int) -> bool:
     """Check if a number is an invalid ID (digits repeated at least twice).
 
@@ -258,10 +258,56 @@ def find_invalid_sum_in_range_part2_optimized(start: int, end: int) -> int:
     return sum(invalid_ids)
 
 
+@lru_cache(maxsize=None)
+def _mobius(n: int) -> int:
+    """Möbius function: 0 if n has a squared prime factor, else (-1)^(number of primes)."""
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def _is_prime(n: int) -> bool:
+    return n > 1 and all(n % p for p in range(2, int(n**0.5) + 1))
+
+
+def find_invalid_sum_in_range_part2_closed_form(start: int, end: int) -> int:
+    """Find sum of all invalid IDs in range for part 2, without enumeration.
+
+    Let S(k) be the sum of d-digit numbers in the range that repeat some
+    k-digit base (an arithmetic series, as in part 1), and P(p) the sum of
+    those whose smallest repeating unit has exactly p digits. Every number
+    repeating a k-digit base has a smallest unit p dividing k, so
+    S(k) = sum of P(p) over p | k, and by Möbius inversion
+    P(d) = sum of mobius(d / k) * S(k) over k | d. The invalid IDs are the
+    d-digit numbers whose smallest unit is shorter than d:
+
+        S(d) - P(d) = -sum of mobius(d / k) * S(k) over k | d, k < d
+
+    This is O(number of divisors) per digit length, whatever the range
+    width. The weights and multipliers are the memoised AT_LEAST_TWICE
+    tables of find_repeated_sum_in_range.
+
+    Args:
+        start: Start of range (inclusive)
+        end: End of range (inclusive)
+
+    Returns:
+        Sum of all invalid IDs in the range
+    """
+    return find_repeated_sum_in_range(start, end, AT_LEAST_TWICE)
+
+
 def solve_part2(ranges: list[tuple[int, int]]) -> int:
     """Solve part 2: sum all invalid IDs (repeated at least twice) across all ranges.
 
-    Uses the optimized version with early-exit and removed redundant checks.
+    Uses the closed-form Möbius inclusion-exclusion per range.
 
     Args:
         ranges: List of (start, end) range tuples
@@ -271,5 +317,403 @@ def solve_part2(ranges: list[tuple[int, int]]) -> int:
     """
     total = 0
     for start, end in ranges:
-        total += find_invalid_sum_in_range_part2_optimized(start, end)
+        total += find_invalid_sum_in_range_part2_closed_form(start, end)
+    return total
+
+
+def _class_sum(classes: tuple[tuple[int, int], ...], lo: int, hi: int) -> int:
+    """Weighted sum of the multiples of each class multiplier in [lo, hi].
+
+    With lo and hi inside one digit length d, the multiples of a class
+    multiplier are exactly the IDs base * multiplier for the class's unit
+    length, so this is the Möbius-weighted arithmetic series of that length.
+
+    Args:
+        classes: (weight, multiplier) pairs of one digit length
+        lo: Lower bound (inclusive)
+        hi: Upper bound (inclusive)
+
+    Returns:
+        Sum of weight * base * multiplier over bases in range, all classes
+    """
+    total = 0
+    for weight, multiplier in classes:
+        base_min = -(-lo // multiplier)  # ceil division
+        base_max = hi // multiplier
+        if base_min <= base_max:
+            total += weight * multiplier * ((base_max - base_min + 1) * (base_min + base_max) // 2)
+    return total
+
+
+def _class_count(classes: tuple[tuple[int, int], ...], lo: int, hi: int) -> int:
+    """Weighted count of the multiples of each class multiplier in [lo, hi]."""
+    count = 0
+    for weight, multiplier in classes:
+        base_min = -(-lo // multiplier)
+        base_max = hi // multiplier
+        if base_min <= base_max:
+            count += weight * (base_max - base_min + 1)
+    return count
+
+
+class InvalidIdIndex:
+    """Precomputed prefix counts and sums of invalid IDs for both parts.
+
+    Invalid IDs with d digits are grouped into classes, one per repeating
+    unit length k: base * multiplier for every k-digit base. Part 1 has the
+    single class k = d / 2 per even d; part 2 has Möbius-weighted classes.
+    Both come from the memoised tables of find_repeated_sum_in_range
+    (EXACTLY_TWICE and AT_LEAST_TWICE). With every
+    class and the totals of all shorter digit lengths precomputed,
+    f(bound) = (count, sum) of invalid IDs <= bound costs O(classes of one
+    length), and a range is f(end) - f(start - 1). A range whose ends have
+    the same length is summed in a single pass over that length's classes.
+    """
+
+    def __init__(self, max_digits: int = 20):
+        """Precompute classes for IDs of up to max_digits digits.
+
+        Args:
+            max_digits: Largest supported ID length.
+        """
+        self.max_digits = max_digits
+        # _powers[i] = 10^(i+1); a number below _powers[d - 1] has at most d digits
+        self._powers = [10 ** (d + 1) for d in range(max_digits)]
+        # Numbers of one bit length span at most one power of ten, so the
+        # digits of 2^(b-1) are the digits of n, or one less
+        self._bit_digits = [1] + [len(str(1 << (b - 1))) for b in range(1, self._powers[-1].bit_length() + 1)]
+        # _classes[part][d] = (weight, multiplier) pairs for d-digit IDs
+        self._classes = {1: [()], 2: [()]}
+        # _below[part][d] = (count, sum) of invalid IDs with at most d digits
+        self._below = {1: [(0, 0)], 2: [(0, 0)]}
+
+        for d in range(1, max_digits + 1):
+            for part, rule in ((1, EXACTLY_TWICE), (2, AT_LEAST_TWICE)):
+                smallest, largest, classes = _pattern_classes(10, d, rule)
+                self._classes[part].append(classes)
+                count, total = self._below[part][-1]
+                self._below[part].append((
+                    count + _class_count(classes, smallest, largest),
+                    total + _class_sum(classes, smallest, largest),
+                ))
+
+    def _digits(self, n: int) -> int:
+        if n >= self._powers[-1]:
+            raise ValueError(f"{n} has more than {self.max_digits} digits")
+        d = self._bit_digits[n.bit_length()]
+        return d + 1 if n >= self._powers[d - 1] else d
+
+    def _prefix_sum(self, bound: int, part: int) -> int:
+        """Sum of invalid IDs in [1, bound]; prefix without the count."""
+        if bound < 1:
+            return 0
+        d = self._digits(bound)
+        return self._below[part][d - 1][1] + _class_sum(self._classes[part][d], 10 ** (d - 1), bound)
+
+    def prefix(self, bound: int, part: int = 1) -> tuple[int, int]:
+        """Return (count, sum) of invalid IDs in [1, bound].
+
+        Args:
+            bound: Inclusive upper bound.
+            part: 1 for repeated exactly twice, 2 for at least twice.
+
+        Returns:
+            Tuple of (count, sum)
+        """
+        if bound < 1:
+            return 0, 0
+        d = self._digits(bound)
+        below_count, below_sum = self._below[part][d - 1]
+        classes = self._classes[part][d]
+        lo = 10 ** (d - 1)
+        return below_count + _class_count(classes, lo, bound), below_sum + _class_sum(classes, lo, bound)
+
+    def range_sum(self, start: int, end: int, part: int = 1) -> int:
+        """Sum of invalid IDs in [start, end].
+
+        When both ends have the same digit length this is one pass over
+        that length's classes; otherwise it is f(end) - f(start - 1).
+        """
+        if start < 1:
+            start = 1
+        if start > end:
+            return 0
+        d = self._digits(end)
+        if start >= self._powers[d - 1] // 10:
+            return _class_sum(self._classes[part][d], start, end)
+        return self._prefix_sum(end, part) - self._prefix_sum(start - 1, part)
+
+    def batch_range_sums(self, starts: list[int], ends: list[int], part: int = 1) -> list[int]:
+        """Sums of invalid IDs for many ranges [starts[i], ends[i]].
+
+        Args:
+            starts: Range starts (inclusive).
+            ends: Range ends (inclusive), same length as starts.
+            part: 1 for repeated exactly twice, 2 for at least twice.
+
+        Returns:
+            List of range sums, in input order.
+        """
+        range_sum = self.range_sum
+        return [range_sum(start, end, part) for start, end in zip(starts, ends)]
+
+    def count(self, start: int, end: int, part: int = 1) -> int:
+        """Number of invalid IDs in [start, end]."""
+        return self.prefix(end, part)[0] - self.prefix(start - 1, part)[0]
+
+    def select(self, start: int, k: int, part: int = 1) -> int | None:
+        """Return the k-th invalid ID at or after start (k = 1 is the first).
+
+        Finds the digit length holding the target rank from the per-length
+        totals, then the smallest bound of that length whose prefix count
+        reaches it. For part 1 that is direct arithmetic; for part 2 it is
+        a binary search over the bound, O(digits * classes).
+
+        Args:
+            start: Lower bound (inclusive).
+            k: Rank, 1-based.
+            part: 1 for repeated exactly twice, 2 for at least twice.
+
+        Returns:
+            The invalid ID, or None if it would exceed max_digits digits.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        target = self.prefix(start - 1, part)[0] + k
+        below = self._below[part]
+        d = bisect_right(below, target - 1, key=lambda entry: entry[0])
+        if d > self.max_digits:
+            return None
+
+        rank = target - below[d - 1][0]  # Rank within length d, 1-based
+        classes = self._classes[part][d]
+        lo, hi = 10 ** (d - 1), 10**d - 1
+        if part == 1:
+            (_, multiplier), = classes
+            return (-(-lo // multiplier) + rank - 1) * multiplier
+
+        # Offsetting by the smallest base of each class leaves
+        # count(x) = sum(w * (x // m))
+        rank += sum(weight * ((lo - 1) // multiplier) for weight, multiplier in classes)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            count = 0
+            for weight, multiplier in classes:
+                count += weight * (mid // multiplier)
+            if count >= rank:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def total(self, ranges: list[tuple[int, int]], part: int = 1) -> int:
+        """Sum of invalid IDs over all ranges (the part 1 or part 2 answer)."""
+        range_sum = self.range_sum
+        return sum(range_sum(start, end, part) for start, end in ranges)
+
+
+@lru_cache(maxsize=None)
+def _default_index() -> InvalidIdIndex:
+    return InvalidIdIndex()
+
+
+def count_invalid_in_range(start: int, end: int, part: int = 1) -> int:
+    """Count invalid IDs in [start, end] without enumerating them.
+
+    Args:
+        start: Start of range (inclusive)
+        end: End of range (inclusive)
+        part: 1 for repeated exactly twice, 2 for at least twice
+
+    Returns:
+        Number of invalid IDs in the range
+    """
+    return _default_index().count(start, end, part)
+
+
+def select_invalid(start: int, k: int, part: int = 1) -> int | None:
+    """Find the k-th invalid ID at or after start without enumerating.
+
+    Args:
+        start: Lower bound (inclusive)
+        k: Rank, 1-based (k = 1 is the first invalid ID >= start)
+        part: 1 for repeated exactly twice, 2 for at least twice
+
+    Returns:
+        The invalid ID, or None if there are fewer than k up to 20 digits
+    """
+    return _default_index().select(start, k, part)
+
+
+def iter_invalid_in_range(start: int, end: int) -> Iterator[int]:
+    """Lazily yield part 1 invalid IDs in [start, end] in ascending order.
+
+    Same IDs as find_invalid_in_range, without building a list. For each
+    even digit length the IDs are base * (10^k + 1) for increasing bases,
+    and shorter lengths come first, so no sorting is needed.
+
+    Args:
+        start: Start of range (inclusive)
+        end: End of range (inclusive)
+
+    Yields:
+        Invalid IDs in ascending order
+    """
+    for d in range(len(str(start)), len(str(end)) + 1):
+        if d % 2:
+            continue
+        k = d // 2
+        multiplier = 10**k + 1
+        base_min = max(10 ** (k - 1), -(-start // multiplier))
+        base_max = min(10**k - 1, end // multiplier)
+        yield from range(base_min * multiplier, base_max * multiplier + 1, multiplier)
+
+
+def iter_invalid_in_range_part2(start: int, end: int) -> Iterator[int]:
+    """Lazily yield part 2 invalid IDs in [start, end] in ascending order.
+
+    Within one digit length d, every pattern class is an arithmetic
+    progression base * multiplier. Only units of length d / p for primes
+    p | d are needed, since any shorter repeating unit also repeats within
+    one of those. The progressions are k-way merged through a heap (as
+    lazy range objects) and duplicates such as 111111 = 111 * 1001 =
+    11 * 10101 are dropped as they come out adjacent. Memory is bounded by
+    the number of progressions.
+
+    Args:
+        start: Start of range (inclusive)
+        end: End of range (inclusive)
+
+    Yields:
+        Invalid IDs in ascending order, each once
+    """
+    for d in range(len(str(start)), len(str(end)) + 1):
+        lo = max(start, 10 ** (d - 1))
+        hi = min(end, 10**d - 1)
+        progressions = []
+        for k in range(1, d // 2 + 1):
+            if d % k == 0 and _is_prime(d // k):
+                multiplier = (10**d - 1) // (10**k - 1)
+                base_min = -(-lo // multiplier)
+                base_max = hi // multiplier
+                if base_min <= base_max:
+                    progressions.append(
+                        range(base_min * multiplier, base_max * multiplier + 1, multiplier)
+                    )
+
+        previous = None
+        for invalid_id in merge(*progressions):
+            if invalid_id != previous:
+                yield invalid_id
+                previous = invalid_id
+
+
+# Repetition-count rules for the generalised engine. Any hashable
+# container of allowed repeat counts works, e.g. frozenset({3}).
+EXACTLY_TWICE = frozenset({2})
+AT_LEAST_TWICE = range(2, maxsize)
+
+
+@lru_cache(maxsize=None)
+def _pattern_weights(d: int, repetitions: Container[int]) -> tuple[tuple[int, int], ...]:
+    """Inclusion-exclusion weights (k, c(k)) for d-digit IDs under a rule.
+
+    A d-digit ID whose smallest repeating unit has p digits repeats a
+    k-digit unit exactly when p | k | d, so it matches the rule when
+    p | d / r for some allowed r with r | d. With S(k) the sum over IDs
+    repeating a k-digit unit, Möbius inversion gives the rule's total as
+    sum of c(k) * S(k), where c(k) = sum of mobius(p / k) over matching p
+    that are multiples of k. Depends only on d and the rule, not the radix.
+    """
+    divisors = [k for k in range(1, d + 1) if d % k == 0]
+    units = [d // r for r in divisors if r in repetitions]
+    matching = [p for p in divisors if any(unit % p == 0 for unit in units)]
+    weights = []
+    for k in divisors:
+        weight = sum(_mobius(p // k) for p in matching if p % k == 0)
+        if weight:
+            weights.append((k, weight))
+    return tuple(weights)
+
+
+@lru_cache(maxsize=None)
+def _pattern_classes(
+    radix: int, d: int, repetitions: Container[int]
+) -> tuple[int, int, tuple[tuple[int, int], ...]]:
+    """Smallest and largest d-digit number plus (weight, multiplier) per unit length.
+
+    The multiplier (radix^d - 1) / (radix^k - 1) repeats a k-digit unit
+    d / k times.
+    """
+    classes = tuple(
+        (weight, (radix**d - 1) // (radix**k - 1))
+        for k, weight in _pattern_weights(d, repetitions)
+    )
+    return radix ** (d - 1), radix**d - 1, classes
+
+
+def _radix_digits(n: int, radix: int) -> int:
+    """Number of digits of n >= 1 in the given radix."""
+    d = 1
+    while n >= radix**d:
+        d += 1
+    return d
+
+
+def find_repeated_sum_in_range(
+    start: int, end: int, repetitions: Container[int] = AT_LEAST_TWICE, radix: int = 10
+) -> int:
+    """Sum IDs in [start, end] made of a unit repeated r times, for r in a rule.
+
+    Generalises parts 1 and 2 to any radix and any set of allowed
+    repetition counts: EXACTLY_TWICE is part 1, AT_LEAST_TWICE is part 2,
+    frozenset({3}) means exactly three times. Multiplier and weight tables
+    are memoised per (radix, digit length, rule) and shared by all calls.
+
+    Args:
+        start: Start of range (inclusive)
+        end: End of range (inclusive)
+        repetitions: Hashable container of allowed repetition counts
+        radix: Number base the IDs are written in
+
+    Returns:
+        Sum of matching IDs in the range
+    """
+    if radix < 2:
+        raise ValueError("radix must be at least 2")
+    start = max(start, 1)
+    if start > end:
+        return 0
+
+    if radix == 10:
+        first, last = len(str(start)), len(str(end))
+    else:
+        first, last = _radix_digits(start, radix), _radix_digits(end, radix)
+
+    total = 0
+    for d in range(first, last + 1):
+        smallest, largest, classes = _pattern_classes(radix, d, repetitions)
+        # Restrict to d-digit numbers; this also keeps bases at k digits
+        lo = start if start > smallest else smallest
+        hi = end if end < largest else largest
+        total += _class_sum(classes, lo, hi)
+    return total
+
+
+def solve_repeated(
+    ranges: list[tuple[int, int]], repetitions: Container[int] = AT_LEAST_TWICE, radix: int = 10
+) -> int:
+    """Sum IDs matching a repetition rule across all ranges.
+
+    Args:
+        ranges: List of (start, end) range tuples
+        repetitions: Hashable container of allowed repetition counts
+        radix: Number base the IDs are written in
+
+    Returns:
+        Sum of matching IDs found in the ranges
+    """
+    total = 0
+    for start, end in ranges:
+        total += find_repeated_sum_in_range(start, end, repetitions, radix)
     return total
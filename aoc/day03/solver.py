@@ -1,3 +1,17 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import compress
+from operator import add
+from typing import Iterable, Iterator
+
+from aoc.utils.map_reduce import MapReduceJob
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; a pure-Python fallback is used
+    np = None
+
+
 def max_joltage(bank: str) -> int:
     """Find the maximum joltage possible from a single bank.
 
@@ -40,6 +54,85 @@ def solve_part1(banks: list[str]) -> int:
     return sum(max_joltage(bank) for bank in banks)
 
 
+def _split_banks(banks: list[str]) -> tuple[list[str], None]:
+    """Map-reduce splitter: every bank is an independent record."""
+    return banks, None
+
+
+def _bank_joltage(record: str, context: None) -> int:
+    """Map-reduce kernel: maximum joltage of one bank."""
+    return max_joltage(record)
+
+
+# Part 1 as a map-reduce job over banks, for aoc.utils.map_reduce
+PART1_JOB = MapReduceJob(_split_banks, _bank_joltage, add)
+
+
+def max_joltage_rows(digits) -> "np.ndarray":
+    """Maximum 2-battery joltage for every row of a 2-D digit array.
+
+    Computes, for each position, the maximum digit strictly to its right
+    with a reversed running maximum along the rows, then takes the best
+    10 * digit + suffix maximum per row. Requires NumPy.
+
+    Args:
+        digits: 2-D uint8 array of digit values, one bank per row (width >= 2)
+
+    Returns:
+        1-D array with the maximum joltage of each row
+    """
+    suffix_max = np.maximum.accumulate(digits[:, :0:-1], axis=1)[:, ::-1]
+    return (digits[:, :-1] * 10 + suffix_max).max(axis=1)
+
+
+def solve_part1_bytes(data: bytes) -> int:
+    """Solve part 1 directly from the raw input bytes.
+
+    With NumPy, equal-length banks are viewed in place as one 2-D digit
+    array (other inputs are left-padded with zeros, which never beat a
+    real pair) and solved by max_joltage_rows. Without NumPy, each bank is solved with
+    C-level bytes operations: the first battery is the leftmost maximum
+    of all but the last digit, the second the maximum after it.
+
+    Args:
+        data: Raw puzzle input, one bank per line
+
+    Returns:
+        Sum of maximum joltage from each bank
+    """
+    data = data.replace(b"\r", b"").strip()
+    if np is not None and data:
+        # Fast path: equal-length lines are one strided 2-D view of the buffer
+        raw = np.frombuffer(data + b"\n", dtype=np.uint8)
+        newlines = np.flatnonzero(raw == 10)
+        width = int(newlines[0])
+        if width >= 2 and len(raw) == len(newlines) * (width + 1) and np.all(raw[width::width + 1] == 10):
+            digits = raw.reshape(len(newlines), width + 1)[:, :width] - 48
+            return int(max_joltage_rows(digits).sum(dtype=np.int64))
+
+    lines = data.split()
+    if not lines:
+        return 0
+
+    if np is None:
+        total = 0
+        for bank in lines:
+            if len(bank) < 2:
+                continue
+            first = max(bank[:-1])
+            second = max(bank[bank.index(first) + 1:])
+            total += (first - 48) * 10 + (second - 48)
+        return total
+
+    # Banks shorter than 2 score 0; the rest are left-padded with "0"
+    width = max(len(bank) for bank in lines)
+    lines = [bank.rjust(width, b"0") for bank in lines if len(bank) >= 2]
+    if not lines:
+        return 0
+    digits = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), width) - 48
+    return int(max_joltage_rows(digits).sum(dtype=np.int64))
+
+
 def max_joltage_k(bank: str, k: int) -> int:
     """Find the maximum joltage by selecting exactly k batteries.
 
@@ -73,6 +166,44 @@ def max_joltage_k(bank: str, k: int) -> int:
     return int(result)
 
 
+def max_joltage_all_k(bank: str, as_int: bool = False) -> list[str] | list[int]:
+    """Find the maximum joltage for every battery count k from 1 to len(bank).
+
+    Removing digits one at a time, always the first digit smaller than its
+    successor (or the last digit if there is none), gives the best
+    sequence for every length along the way; this is the order in which
+    max_joltage_k's monotonic stack pops digits, followed by the leftover
+    stack from the right. One stack pass records each digit's removal
+    rank in O(n); the answer for k keeps the digits removed last.
+    Building each answer is a C-level itertools.compress over the bank.
+
+    Args:
+        bank: String of digits representing battery joltage ratings
+        as_int: Return integers instead of digit strings
+
+    Returns:
+        List where entry k - 1 is the best k-digit joltage
+    """
+    n = len(bank)
+    removal_order = []
+    stack = []
+    for i, digit in enumerate(bank):
+        while stack and digit > bank[stack[-1]]:
+            removal_order.append(stack.pop())
+        stack.append(i)
+    removal_order.extend(reversed(stack))
+
+    # The digit removed last is kept for k = 1, the one before it joins at
+    # k = 2, and so on
+    keep = bytearray(n)
+    results = []
+    for k in range(1, n + 1):
+        keep[removal_order[n - k]] = 1
+        best = "".join(compress(bank, keep))
+        results.append(int(best) if as_int else best)
+    return results
+
+
 def solve_part2(banks: list[str]) -> int:
     """Solve part 2: sum all maximum joltages with k=12 batteries.
 
@@ -83,3 +214,220 @@ def solve_part2(banks: list[str]) -> int:
         Sum of maximum joltage from each bank using 12 batteries
     """
     return sum(max_joltage_k(bank, 12) for bank in banks)
+
+
+class BankIndex:
+    """Sparse table over a bank for repeated best-k-digit queries.
+
+    Each entry encodes (digit, leftmost position) of the best battery in a
+    power-of-two window as one int, digit * n + (n - 1 - position), so a
+    plain max picks the largest digit and, among equals, the leftmost.
+    The best k-digit subsequence is then the greedy choice of the
+    leftmost maximum in each window that still leaves room for the
+    remaining picks: k O(1) range-max queries after O(n log n) building.
+    """
+
+    def __init__(self, bank: str):
+        """Build the sparse table for a bank.
+
+        Args:
+            bank: String of digits representing battery joltage ratings
+        """
+        n = len(bank)
+        self.bank = bank
+        self.n = n
+        level = [int(digit) * n + (n - 1 - i) for i, digit in enumerate(bank)]
+        self._table = [level]
+        width = 1
+        while 2 * width <= n:
+            level = [max(a, b) for a, b in zip(level, level[width:])]
+            self._table.append(level)
+            width *= 2
+
+    def _best(self, lo: int, hi: int) -> int:
+        """Position of the leftmost maximum digit in bank[lo:hi + 1]."""
+        j = (hi - lo + 1).bit_length() - 1
+        level = self._table[j]
+        key = max(level[lo], level[hi - (1 << j) + 1])
+        return self.n - 1 - key % self.n
+
+    def max_joltage_k(self, k: int) -> int:
+        """Maximum joltage from exactly k batteries, in O(k).
+
+        Args:
+            k: Number of batteries to select
+
+        Returns:
+            Same value as max_joltage_k(bank, k)
+        """
+        n = self.n
+        if k <= 0 or k > n:
+            return 0
+        digits = []
+        pos = 0
+        for remaining in range(k, 0, -1):
+            pos = self._best(pos, n - remaining)
+            digits.append(self.bank[pos])
+            pos += 1
+        return int("".join(digits))
+
+    def max_joltage_many(self, ks: list[int]) -> list[int]:
+        """Maximum joltage for each k in ks."""
+        return [self.max_joltage_k(k) for k in ks]
+
+
+def _solve_chunk(banks: list[str]) -> tuple[int, int]:
+    """Part 1 and part 2 sums for one chunk of banks (runs in a worker)."""
+    return solve_part1(banks), solve_part2(banks)
+
+
+def _iter_bank_chunks(source: Iterable[str | bytes], chunk_size: int) -> Iterator[list[str]]:
+    """Group lines from a file object into lists of at most chunk_size banks."""
+    chunk = []
+    for line in source:
+        if isinstance(line, bytes):
+            line = line.decode()
+        line = line.strip()
+        if line:
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def solve_stream(
+    source: Iterable[str | bytes],
+    chunk_size: int = 10_000,
+    processes: int | None = None,
+) -> tuple[int, int]:
+    """Solve both parts from a bank file without loading it all.
+
+    Lines are read lazily and grouped into chunks, which are solved for
+    k = 2 and k = 12 in a process pool. At most two chunks per worker are
+    in flight, and partial sums are added as chunks complete, so memory
+    stays bounded by chunk_size times the number of workers.
+
+    Args:
+        source: File object (text or binary) or iterable of lines, one bank per line
+        chunk_size: Banks per chunk
+        processes: Number of worker processes (default: CPU count)
+
+    Returns:
+        Tuple of (part 1 answer, part 2 answer)
+    """
+    processes = processes or os.cpu_count() or 1
+    max_in_flight = 2 * processes
+    part1 = 0
+    part2 = 0
+    with ProcessPoolExecutor(processes) as executor:
+        pending = set()
+        for chunk in _iter_bank_chunks(source, chunk_size):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    a, b = future.result()
+                    part1 += a
+                    part2 += b
+            pending.add(executor.submit(_solve_chunk, chunk))
+
+        for future in wait(pending).done:
+            a, b = future.result()
+            part1 += a
+            part2 += b
+    return part1, part2
+
+
+class MutableBank:
+    """A bank with point digit updates and maintained joltage answers.
+
+    Backed by an iterative segment tree over battery positions. Every node
+    stores, for its range, the best (digit, leftmost position) as one
+    encoded key like BankIndex, and the best 2-battery joltage inside the
+    range: max(left best, right best, 10 * left max + right max). An
+    update rewrites one leaf-to-root path in O(log n); the 2-digit answer
+    is read from the root in O(1), and the k-digit answer uses k range-max
+    queries in O(k log n).
+    """
+
+    _EMPTY = -100  # Max digit of an empty range; never wins a pair
+
+    def __init__(self, bank: str):
+        """Build the tree for a bank.
+
+        Args:
+            bank: String of digits representing battery joltage ratings
+        """
+        n = len(bank)
+        size = 1
+        while size < max(n, 1):
+            size *= 2
+        self.n = n
+        self._size = size
+        self._digits = [int(digit) for digit in bank]
+        self._key = [-1] * (2 * size)
+        self._max = [self._EMPTY] * (2 * size)
+        self._best = [-1] * (2 * size)
+        for i, digit in enumerate(self._digits):
+            self._key[size + i] = digit * n + (n - 1 - i)
+            self._max[size + i] = digit
+        for node in range(size - 1, 0, -1):
+            self._pull(node)
+
+    def _pull(self, node: int) -> None:
+        left, right = 2 * node, 2 * node + 1
+        key, best, high = self._key, self._best, self._max
+        key[node] = max(key[left], key[right])
+        high[node] = max(high[left], high[right])
+        best[node] = max(best[left], best[right], 10 * high[left] + high[right])
+
+    def update(self, position: int, digit: int) -> None:
+        """Set the battery at position to digit in O(log n)."""
+        if not 0 <= position < self.n:
+            raise IndexError("bank position out of range")
+        self._digits[position] = digit
+        node = self._size + position
+        self._key[node] = digit * self.n + (self.n - 1 - position)
+        self._max[node] = digit
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def max_joltage(self) -> int:
+        """Current maximum 2-battery joltage, same as max_joltage(str(self))."""
+        return max(self._best[1], 0)
+
+    def _leftmost_max(self, lo: int, hi: int) -> int:
+        """Position of the leftmost maximum digit in [lo, hi]."""
+        key = self._key
+        best = -1
+        lo += self._size
+        hi += self._size + 1
+        while lo < hi:
+            if lo & 1:
+                best = max(best, key[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = max(best, key[hi])
+            lo //= 2
+            hi //= 2
+        return self.n - 1 - best % self.n
+
+    def max_joltage_k(self, k: int) -> int:
+        """Current maximum joltage from exactly k batteries, in O(k log n)."""
+        n = self.n
+        if k <= 0 or k > n:
+            return 0
+        digits = []
+        pos = 0
+        for remaining in range(k, 0, -1):
+            pos = self._leftmost_max(pos, n - remaining)
+            digits.append(self._digits[pos])
+            pos += 1
+        return int("".join(map(str, digits)))
+
+    def __str__(self) -> str:
+        return "".join(map(str, self._digits))
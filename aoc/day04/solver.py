@@ -1,3 +1,12 @@
+from array import array
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the bitboard engine is used instead
+    np = None
+
+
 def count_adjacent_rolls(grid: list[str], row: int, col: int) -> int:
     """Count paper rolls (@) in the 8 adjacent positions."""
     count = 0
@@ -84,3 +93,529 @@ def solve_part2(grid: list[str]) -> int:
                         queued.add((nr, nc))
 
     return total_removed
+
+
+# Bitboard engine: each row is a Python int with bit c set when column c
+# holds a roll, so one big-int operation handles a whole row at once.
+
+_TO_BITS = str.maketrans("@.", "10")
+
+
+def to_bitboard(grid: list[str]) -> list[int]:
+    """Convert a grid to one bitmask per row (bit c = column c)."""
+    return [int(row.translate(_TO_BITS)[::-1] or "0", 2) for row in grid]
+
+
+def _accessible_row(above: int, row: int, below: int) -> int:
+    """Return the rolls in row with fewer than 4 neighbouring rolls.
+
+    The eight neighbour planes are summed with bit-sliced adders: s0 and
+    s1 hold the low two bits of every column's count, and ge4 collects
+    the carries out of s1, i.e. columns whose count reached 4.
+    """
+    s0 = s1 = ge4 = 0
+    for plane in (above << 1, above, above >> 1, row << 1, row >> 1,
+                  below << 1, below, below >> 1):
+        carry = s0 & plane
+        s0 ^= plane
+        ge4 |= s1 & carry
+        s1 ^= carry
+    return row & ~ge4
+
+
+def accessible_bitboard(rows: list[int]) -> list[int]:
+    """Return per-row bitmasks of the rolls with fewer than 4 neighbours.
+
+    Args:
+        rows: Bitboard from to_bitboard
+
+    Returns:
+        List of masks, one per row
+    """
+    padded = [0] + rows + [0]
+    return [_accessible_row(padded[r], padded[r + 1], padded[r + 2])
+            for r in range(len(rows))]
+
+
+def solve_part1_bitboard(grid: list[str]) -> int:
+    """Count accessible rolls using the bitboard engine."""
+    return sum(mask.bit_count() for mask in accessible_bitboard(to_bitboard(grid)))
+
+
+def solve_part2_bitboard(grid: list[str]) -> int:
+    """Count removable rolls by peeling whole bitboard rounds.
+
+    Each round removes every currently accessible roll at once. The
+    final state does not depend on removal order, so this matches the
+    worklist in solve_part2. Only rows next to a row that changed in the
+    previous round are re-examined.
+    """
+    rows = [0] + to_bitboard(grid) + [0]
+    last = len(rows) - 2
+    dirty = range(1, last + 1)
+    total_removed = 0
+
+    while dirty:
+        removed = []
+        for r in dirty:
+            mask = _accessible_row(rows[r - 1], rows[r], rows[r + 1])
+            if mask:
+                removed.append((r, mask))
+        for r, mask in removed:
+            rows[r] &= ~mask
+            total_removed += mask.bit_count()
+        dirty = sorted({n for r, _ in removed for n in (r - 1, r, r + 1) if 1 <= n <= last})
+
+    return total_removed
+
+
+# NumPy engine: the grid is a one-cell-padded uint8 array and neighbour
+# counts are a 3x3 box sum built from shifted slices.
+
+def to_array(grid: list[str]) -> "np.ndarray":
+    """Convert a grid to a padded 2-D uint8 array (1 = roll). Requires NumPy."""
+    rows, cols = len(grid), len(grid[0])
+    cells = np.frombuffer("".join(grid).encode(), dtype=np.uint8).reshape(rows, cols)
+    padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = cells == ord('@')
+    return padded
+
+
+def neighbour_counts(padded: "np.ndarray") -> "np.ndarray":
+    """Number of neighbouring rolls of every cell of a padded roll array.
+
+    Returns an int8 array of the same shape; the border is left at 0.
+    """
+    rows, cols = padded.shape
+    counts = np.zeros((rows, cols), dtype=np.int8)
+    inner = counts[1:-1, 1:-1]
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr != 1 or dc != 1:
+                inner += padded[dr:dr + rows - 2, dc:dc + cols - 2]
+    return counts
+
+
+def solve_part1_numpy(grid: list[str]) -> int:
+    """Count accessible rolls with a vectorised box sum.
+
+    Falls back to the bitboard engine when NumPy is not installed.
+    """
+    if np is None:
+        return solve_part1_bitboard(grid)
+    padded = to_array(grid)
+    accessible = padded.view(bool) & (neighbour_counts(padded) < 4)
+    return int(np.count_nonzero(accessible))
+
+
+def solve_part2_numpy(grid: list[str]) -> int:
+    """Count removable rolls with vectorised frontier rounds.
+
+    Each round removes the whole frontier at once, decrements the counts
+    of its neighbours (one fancy-indexed update per offset; the frontier
+    has no duplicates, so neither does any single shift of it), and takes
+    as the next frontier those neighbours that are still rolls and have
+    become accessible. Work per round is proportional to the frontier,
+    not the grid.
+
+    Falls back to the bitboard engine when NumPy is not installed.
+    """
+    if np is None:
+        return solve_part2_bitboard(grid)
+    padded = to_array(grid)
+    width = padded.shape[1]
+    rolls = padded.ravel()
+    counts = neighbour_counts(padded).ravel()
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+    frontier = np.flatnonzero(rolls.view(bool) & (counts < 4))
+    total_removed = 0
+    while frontier.size:
+        rolls[frontier] = 0
+        total_removed += frontier.size
+        shifted = [frontier + offset for offset in offsets]
+        for cells in shifted:
+            counts[cells] -= 1  # border cells may go negative; never rolls
+        neighbours = np.concatenate(shifted)
+        candidates = neighbours[(rolls[neighbours] == 1) & (counts[neighbours] < 4)]
+        candidates.sort()
+        keep = np.empty(candidates.size, dtype=bool)
+        keep[:1] = True
+        np.not_equal(candidates[1:], candidates[:-1], out=keep[1:])
+        frontier = candidates[keep]
+    return total_removed
+
+
+# Flat engine: the grid is a one-cell-padded bytearray indexed by integer
+# cell ids, so neighbours are fixed offsets and no tuples are allocated.
+
+_TO_BYTES = bytes.maketrans(b"@.", b"\x01\x00")
+
+
+def to_flat(grid: list[str]) -> tuple[bytearray, int]:
+    """Convert a grid to a padded flat bytearray (1 = roll).
+
+    Returns:
+        Tuple of (cells, width), where width is the padded row length
+        and cell (r, c) of the grid has id (r + 1) * width + c + 1
+    """
+    width = len(grid[0]) + 2
+    border = bytes(width)
+    cells = bytearray(border)
+    for row in grid:
+        cells += b"\0" + row.encode().translate(_TO_BYTES) + b"\0"
+    cells += border
+    return cells, width
+
+
+def _neighbour_offsets(width: int) -> tuple[int, ...]:
+    return (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+
+def flat_neighbour_counts(cells: bytearray, width: int) -> array:
+    """Return an array('b') with the neighbour count of every cell.
+
+    The cells are read as one little-endian big int with a byte per cell;
+    counts never exceed 8, so adding the eight shifted copies sums every
+    cell's neighbours in its own byte without carries.
+    """
+    size = len(cells)
+    packed = int.from_bytes(cells, "little")
+    total = 0
+    for offset in _neighbour_offsets(width):
+        total += packed >> (8 * offset) if offset > 0 else packed << (-8 * offset)
+    total &= (1 << (8 * size)) - 1
+    return array('b', total.to_bytes(size, "little"))
+
+
+def solve_part2_flat(grid: list[str]) -> int:
+    """Count removable rolls with the worklist over flat arrays.
+
+    Same algorithm as solve_part2. A roll is queued when its count drops
+    from 4 to 3, which happens at most once, so no queued set is needed.
+    """
+    cells, width = to_flat(grid)
+    offsets = _neighbour_offsets(width)
+    counts = flat_neighbour_counts(cells, width)
+
+    queue = [cell for cell in compress(range(len(cells)), cells) if counts[cell] < 4]
+    total_removed = 0
+
+    while queue:
+        cell = queue.pop()
+        cells[cell] = 0
+        total_removed += 1
+        for offset in offsets:
+            neighbour = cell + offset
+            if cells[neighbour]:
+                counts[neighbour] -= 1
+                if counts[neighbour] == 3:
+                    queue.append(neighbour)
+
+    return total_removed
+
+
+class RemovalIndex:
+    """Removal round of every roll for every accessibility threshold.
+
+    With threshold t a roll is accessible when it has fewer than t
+    neighbouring rolls (the puzzle uses t = 4). In round 1 every
+    accessible roll is removed at once; round r removes the rolls that
+    became accessible in round r - 1. Building the index runs eight
+    separate round-by-round peels over flat arrays, one per threshold
+    1..8 (not a single pass), sharing only the initial neighbour counts.
+    It records each roll's removal round and the cumulative number of
+    rolls removed after each round, so queries are O(1).
+    """
+
+    __slots__ = ("width", "rounds", "removed")
+
+    THRESHOLDS = range(1, 9)
+
+    def __init__(self, grid: list[str]):
+        """Peel the grid for every threshold.
+
+        Args:
+            grid: List of strings, one per row
+        """
+        cells, width = to_flat(grid)
+        offsets = _neighbour_offsets(width)
+        initial = flat_neighbour_counts(cells, width)
+        roll_ids = list(compress(range(len(cells)), cells))
+
+        self.width = width
+        # rounds[t][cell]: round in which cell is removed at threshold t (0 = never)
+        self.rounds = [None]
+        # removed[t][r]: number of rolls removed after r rounds at threshold t
+        self.removed = [None]
+
+        for threshold in self.THRESHOLDS:
+            alive = bytearray(cells)
+            counts = array('b', initial)
+            rounds = array('I', bytes(4 * len(cells)))
+            removed = [0]
+            frontier = [cell for cell in roll_ids if counts[cell] < threshold]
+            while frontier:
+                current = len(removed)
+                for cell in frontier:
+                    alive[cell] = 0
+                    rounds[cell] = current
+                removed.append(removed[-1] + len(frontier))
+                next_frontier = []
+                for cell in frontier:
+                    for offset in offsets:
+                        neighbour = cell + offset
+                        if alive[neighbour]:
+                            counts[neighbour] -= 1
+                            if counts[neighbour] == threshold - 1:
+                                next_frontier.append(neighbour)
+                frontier = next_frontier
+            self.rounds.append(rounds)
+            self.removed.append(removed)
+
+    def _removed(self, threshold: int) -> list[int]:
+        if threshold not in self.THRESHOLDS:
+            raise ValueError(f"threshold must be in 1..8, got {threshold}")
+        return self.removed[threshold]
+
+    def removed_after(self, rounds: int, threshold: int = 4) -> int:
+        """Number of rolls gone after the given number of rounds, in O(1)."""
+        if rounds < 0:
+            raise ValueError("rounds must be non-negative")
+        removed = self._removed(threshold)
+        return removed[min(rounds, len(removed) - 1)]
+
+    def total(self, threshold: int = 4) -> int:
+        """Number of rolls removed once peeling stops."""
+        return self._removed(threshold)[-1]
+
+    def num_rounds(self, threshold: int = 4) -> int:
+        """Number of rounds that remove at least one roll."""
+        return len(self._removed(threshold)) - 1
+
+    def removed_in_round(self, number: int, threshold: int = 4) -> int:
+        """Number of rolls removed in exactly round number (1-based)."""
+        if number < 1:
+            raise ValueError("round number must be at least 1")
+        return self.removed_after(number, threshold) - self.removed_after(number - 1, threshold)
+
+    def round_of(self, row: int, col: int, threshold: int = 4) -> int:
+        """Round in which the roll at (row, col) is removed (0 = never)."""
+        self._removed(threshold)
+        return self.rounds[threshold][(row + 1) * self.width + col + 1]
+
+
+# Traversal marks used by RollFloor._grow_core
+_QUEUED, _CANDIDATE, _EVICTED = 1, 2, 3
+
+
+class RollFloor:
+    """A floor plan with single-roll insertions and removals.
+
+    Uses the flat padded layout of to_flat. Neighbour counts are kept
+    for every cell, so adding or removing a roll updates eight counts
+    and the number of accessible rolls (part 1) in O(1).
+
+    For part 2 the floor keeps the set of rolls that are never removed:
+    the largest set in which every roll has at least 4 neighbours from
+    the set (the 4-core of the roll adjacency graph). Part 2's answer is
+    the number of rolls outside it. Removing a core roll re-runs the
+    cascade from that roll only. Adding a roll can only grow the core,
+    and every new core roll is connected to the added one through other
+    new core rolls, so a pruned traversal from the added roll finds them
+    (see _grow_core). It visits only rolls that can still reach 4 core
+    neighbours.
+    """
+
+    __slots__ = ("rows", "cols", "width", "_cells", "_counts", "_core",
+                 "_core_counts", "_offsets", "_rolls", "_accessible", "_core_size",
+                 "_mark", "_potential")
+
+    def __init__(self, grid: list[str]):
+        """Build the floor from a grid.
+
+        Args:
+            grid: List of strings, one per row; its size fixes the floor size
+        """
+        cells, width = to_flat(grid)
+        self.rows = len(grid)
+        self.cols = width - 2
+        self.width = width
+        self._offsets = offsets = _neighbour_offsets(width)
+        self._cells = cells
+        self._counts = counts = flat_neighbour_counts(cells, width)
+        roll_ids = list(compress(range(len(cells)), cells))
+        self._rolls = len(roll_ids)
+        self._accessible = sum(1 for cell in roll_ids if counts[cell] < 4)
+
+        # Peel as in solve_part2_flat; the survivors form the core
+        core = bytearray(cells)
+        core_counts = array('b', counts)
+        queue = [cell for cell in roll_ids if core_counts[cell] < 4]
+        for cell in queue:
+            core[cell] = 0
+        while queue:
+            cell = queue.pop()
+            for offset in offsets:
+                neighbour = cell + offset
+                core_counts[neighbour] -= 1
+                if core[neighbour] and core_counts[neighbour] < 4:
+                    core[neighbour] = 0
+                    queue.append(neighbour)
+        self._core = core
+        self._core_counts = core_counts
+        self._core_size = sum(core[cell] for cell in roll_ids)
+        # Scratch state for _grow_core, all zero between updates
+        self._mark = bytearray(len(cells))
+        self._potential = array('b', bytes(len(cells)))
+
+    def _cell(self, row: int, col: int) -> int:
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError("floor position out of range")
+        return (row + 1) * self.width + col + 1
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        row, col = position
+        return bool(self._cells[self._cell(row, col)])
+
+    def add(self, row: int, col: int) -> None:
+        """Place a roll at (row, col).
+
+        Raises:
+            ValueError: If there is already a roll there
+        """
+        cell = self._cell(row, col)
+        cells, counts = self._cells, self._counts
+        if cells[cell]:
+            raise ValueError(f"already a roll at ({row}, {col})")
+        cells[cell] = 1
+        self._rolls += 1
+        for offset in self._offsets:
+            neighbour = cell + offset
+            if cells[neighbour] and counts[neighbour] == 3:
+                self._accessible -= 1
+            counts[neighbour] += 1
+        if counts[cell] < 4:
+            self._accessible += 1
+        self._grow_core(cell)
+
+    def remove(self, row: int, col: int) -> None:
+        """Take away the roll at (row, col).
+
+        Raises:
+            ValueError: If there is no roll there
+        """
+        cell = self._cell(row, col)
+        cells, counts = self._cells, self._counts
+        if not cells[cell]:
+            raise ValueError(f"no roll at ({row}, {col})")
+        cells[cell] = 0
+        self._rolls -= 1
+        if counts[cell] < 4:
+            self._accessible -= 1
+        for offset in self._offsets:
+            neighbour = cell + offset
+            if cells[neighbour] and counts[neighbour] == 4:
+                self._accessible += 1
+            counts[neighbour] -= 1
+        if self._core[cell]:
+            self._shrink_core(cell)
+
+    def _shrink_core(self, cell: int) -> None:
+        """Remove cell from the core and cascade to neighbours left with < 4."""
+        core, core_counts, offsets = self._core, self._core_counts, self._offsets
+        core[cell] = 0
+        self._core_size -= 1
+        queue = [cell]
+        while queue:
+            cell = queue.pop()
+            for offset in offsets:
+                neighbour = cell + offset
+                core_counts[neighbour] -= 1
+                if core[neighbour] and core_counts[neighbour] < 4:
+                    core[neighbour] = 0
+                    self._core_size -= 1
+                    queue.append(neighbour)
+
+    def _grow_core(self, cell: int) -> int:
+        """Find the rolls that join the core after adding cell.
+
+        Pruned traversal from cell over non-core rolls with at least 4
+        neighbouring rolls (no other roll can join). A visited roll gets
+        potential = core neighbours + eligible neighbours not yet evicted,
+        an upper bound on its neighbours in the new core. Only rolls with
+        potential of at least 4 become candidates and are expanded; a
+        candidate whose potential drops below 4 is evicted at once,
+        cascading to its candidate neighbours. The candidates left when
+        the traversal ends join the core.
+
+        Returns:
+            Number of cells visited by the traversal
+        """
+        cells, counts, core, core_counts = self._cells, self._counts, self._core, self._core_counts
+        mark, potential, offsets = self._mark, self._potential, self._offsets
+        visited = []
+        stack = [cell]
+        mark[cell] = _QUEUED
+        while stack:
+            current = stack.pop()
+            visited.append(current)
+            eligible = []
+            for offset in offsets:
+                neighbour = current + offset
+                if (cells[neighbour] and not core[neighbour] and counts[neighbour] >= 4
+                        and mark[neighbour] != _EVICTED):
+                    eligible.append(neighbour)
+            count = core_counts[current] + len(eligible)
+            if count < 4:
+                self._evict(current)
+                continue
+            mark[current] = _CANDIDATE
+            potential[current] = count
+            for neighbour in eligible:
+                if not mark[neighbour]:
+                    mark[neighbour] = _QUEUED
+                    stack.append(neighbour)
+
+        joined = 0
+        for current in visited:
+            if mark[current] == _CANDIDATE:
+                core[current] = 1
+                joined += 1
+                for offset in offsets:
+                    core_counts[current + offset] += 1
+        for current in visited:
+            mark[current] = 0
+        self._core_size += joined
+        return len(visited)
+
+    def _evict(self, cell: int) -> None:
+        """Evict cell from the traversal, cascading to candidate neighbours."""
+        mark, potential, offsets = self._mark, self._potential, self._offsets
+        mark[cell] = _EVICTED
+        stack = [cell]
+        while stack:
+            current = stack.pop()
+            for offset in offsets:
+                neighbour = current + offset
+                if mark[neighbour] == _CANDIDATE:
+                    potential[neighbour] -= 1
+                    if potential[neighbour] < 4:
+                        mark[neighbour] = _EVICTED
+                        stack.append(neighbour)
+
+    def accessible(self) -> int:
+        """Current part 1 answer, same as solve_part1(self.grid())."""
+        return self._accessible
+
+    def removable(self) -> int:
+        """Current part 2 answer, same as solve_part2(self.grid())."""
+        return self._rolls - self._core_size
+
+    def grid(self) -> list[str]:
+        """Render the current floor as a grid of strings."""
+        width, cells = self.width, self._cells
+        return [
+            "".join('@' if cell else '.' for cell in cells[(r + 1) * width + 1:(r + 2) * width - 1])
+            for r in range(self.rows)
+        ]
@@ -1,4 +1,7 @@
 import bisect
+from operator import add
+
+from aoc.utils.map_reduce import MapReduceJob
 
 
 def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
@@ -74,6 +77,23 @@ def solve_part1(ranges: list[tuple[int, int]], ingredient_ids: list[int]) -> int
     return sum(1 for id in ingredient_ids if is_fresh(id, merged))
 
 
+def _split_ingredients(
+    inventory: tuple[list[tuple[int, int]], list[int]]
+) -> tuple[list[int], list[tuple[int, int]]]:
+    """Map-reduce splitter: ingredient IDs are the records, merged ranges the context."""
+    ranges, ingredient_ids = inventory
+    return ingredient_ids, merge_ranges(ranges)
+
+
+def _fresh_count(record: int, merged_ranges: list[tuple[int, int]]) -> int:
+    """Map-reduce kernel: 1 if the ingredient ID is fresh, else 0."""
+    return 1 if is_fresh(record, merged_ranges) else 0
+
+
+# Part 1 as a map-reduce job over (ranges, ingredient_ids), for aoc.utils.map_reduce
+PART1_JOB = MapReduceJob(_split_ingredients, _fresh_count, add)
+
+
 def solve_part2(ranges: list[tuple[int, int]], ingredient_ids: list[int]) -> int:
     """Count total unique ingredient IDs covered by all ranges.
 
@@ -1,6 +1,23 @@
 from functools import reduce
 from operator import add, mul
 
+from aoc.utils.map_reduce import MapReduceJob
+
+
+def evaluate_problem(numbers: list[int], operator: str) -> int:
+    """Apply a problem's operator to all of its numbers.
+
+    Args:
+        numbers: The problem's numbers
+        operator: '+' or '*'
+
+    Returns:
+        The problem's result
+    """
+    if operator == '+':
+        return reduce(add, numbers)
+    return reduce(mul, numbers)  # operator == '*'
+
 
 def solve_part1(problems: list[tuple[list[int], str]]) -> int:
     """Solve all problems and return the grand total.
@@ -18,15 +35,28 @@ def solve_part1(problems: list[tuple[list[int], str]]) -> int:
     total = 0
 
     for numbers, operator in problems:
-        if operator == '+':
-            result = reduce(add, numbers)
-        else:  # operator == '*'
-            result = reduce(mul, numbers)
-        total += result
+        total += evaluate_problem(numbers, operator)
 
     return total
 
 
+def _split_problems(
+    problems: list[tuple[list[int], str]]
+) -> tuple[list[tuple[list[int], str]], None]:
+    """Map-reduce splitter: every problem is an independent record."""
+    return problems, None
+
+
+def _problem_result(record: tuple[list[int], str], context: None) -> int:
+    """Map-reduce kernel: result of one worksheet problem."""
+    return evaluate_problem(*record)
+
+
+# Part 1 as a map-reduce job over problems, for aoc.utils.map_reduce; part 2
+# reuses it unchanged on the output of parse_worksheet_part2
+PART1_JOB = MapReduceJob(_split_problems, _problem_result, add)
+
+
 def solve_part2(problems: list[tuple[list[int], str]]) -> int:
     """Solve all problems (Part 2) and return the grand total.
 
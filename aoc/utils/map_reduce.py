@@ -0,0 +1,107 @@
+"""Map-reduce executor for answers that are associative over records.
+
+A day declares a `MapReduceJob`: how to split its parsed input into
+independent records (plus any shared read-only context), the per-record
+kernel, and how to combine partial results. The executor shards the
+records, runs each shard on a node, reduces within the shard, and then
+reduces the shard results as they complete.
+
+`LocalNode` is a local stand-in for a remote node: anything with a
+`submit(fn, *args) -> Future` method can take its place.
+
+Kernels, splitters and combiners are pickled to the workers, so they
+must be module-level functions (not lambdas).
+"""
+import math
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, NamedTuple, Sequence
+
+
+class MapReduceJob(NamedTuple):
+    """A day's declaration of how its answer decomposes over records."""
+
+    split: Callable[[Any], tuple[Sequence, Any]]  # input -> (records, context)
+    kernel: Callable[[Any, Any], Any]  # (record, context) -> partial result
+    combine: Callable[[Any, Any], Any]  # associative and commutative
+    initial: Any = 0  # identity of combine
+
+
+class LocalNode:
+    """A worker node backed by a local process pool."""
+
+    def __init__(self, processes: int | None = None):
+        """Start the node's process pool.
+
+        Args:
+            processes: Number of worker processes (default: CPU count).
+        """
+        self._executor = ProcessPoolExecutor(processes)
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Schedule fn(*args) on the node."""
+        return self._executor.submit(fn, *args)
+
+    def close(self) -> None:
+        """Shut down the node's workers."""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "LocalNode":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _reduce_shard(job: MapReduceJob, records: Sequence, context: Any) -> Any:
+    """Apply the kernel to every record in a shard and combine locally."""
+    kernel, combine = job.kernel, job.combine
+    result = job.initial
+    for record in records:
+        result = combine(result, kernel(record, context))
+    return result
+
+
+def run_map_reduce(
+    job: MapReduceJob,
+    data: Any,
+    shard_size: int | None = None,
+    nodes: list | None = None,
+) -> Any:
+    """Run a job over a day's parsed input.
+
+    Args:
+        job: The day's map-reduce declaration.
+        data: Parsed input, passed to job.split.
+        shard_size: Records per shard (default: about four shards per CPU).
+        nodes: Nodes to distribute shards over, round-robin. When omitted,
+               a single LocalNode is created for the call.
+
+    Returns:
+        The combined result over all records.
+    """
+    records, context = job.split(data)
+    if not records:
+        return job.initial
+
+    if shard_size is None:
+        shard_size = max(1, math.ceil(len(records) / (4 * (os.cpu_count() or 1))))
+    shards = [records[i:i + shard_size] for i in range(0, len(records), shard_size)]
+
+    own_nodes = nodes is None
+    if own_nodes:
+        nodes = [LocalNode()]
+
+    try:
+        futures = [
+            nodes[i % len(nodes)].submit(_reduce_shard, job, shard, context)
+            for i, shard in enumerate(shards)
+        ]
+        result = job.initial
+        for future in as_completed(futures):
+            result = job.combine(result, future.result())
+        return result
+    finally:
+        if own_nodes:
+            for node in nodes:
+                node.close()
@@ -0,0 +1,117 @@
+"""Low-overhead sampling profiler for the runner.
+
+Instead of tracing every call like cProfile, a CPU-time interval timer
+(SIGPROF) interrupts the process at a fixed rate and the handler records
+the current Python stack. Samples are attributed to a day and stage by
+looking for `aoc.dayNN.parser` / `aoc.dayNN.solver` frames on the stack,
+so solvers need no instrumentation.
+
+Output is in the collapsed-stack format used by flame graph tools:
+    day09;part2;main:main;aoc.day09.solver:solve_part2;... 42
+
+POSIX only (relies on signal.setitimer).
+"""
+import re
+import signal
+import sys
+from collections import Counter
+
+_DAY_MODULE = re.compile(r"^aoc\.day(\d+)\.(parser|solver):")
+
+
+class SamplingProfiler:
+    """Collects stack samples on a CPU-time timer signal."""
+
+    def __init__(self, rate: float = 100.0, max_depth: int = 64):
+        """Create a stopped profiler.
+
+        Args:
+            rate: Samples per second of CPU time.
+            max_depth: Maximum number of frames recorded per sample.
+        """
+        self.interval = 1.0 / rate
+        self.max_depth = max_depth
+        self.samples = Counter()  # tuple of code objects (root first) -> count
+        self._labels = {}  # code object -> "module:function"
+        self._previous_handler = None
+        self._running = False
+
+    def _handle(self, signum, frame) -> None:
+        stack = []
+        labels = self._labels
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            if code not in labels:
+                labels[code] = f"{frame.f_globals.get('__name__', '?')}:{code.co_name}"
+            stack.append(code)
+            frame = frame.f_back
+        stack.reverse()
+        self.samples[tuple(stack)] += 1
+
+    def start(self) -> None:
+        """Install the signal handler and start the timer."""
+        if self._running:
+            return
+        self._previous_handler = signal.signal(signal.SIGPROF, self._handle)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self._running = True
+
+    def stop(self) -> None:
+        """Stop the timer and restore the previous signal handler."""
+        if not self._running:
+            return
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+        self._running = False
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _day_and_stage(self, labels: list[str]) -> tuple[str, str]:
+        """Attribute a stack to (day, stage) from its aoc.dayNN frames."""
+        for label in labels:
+            match = _DAY_MODULE.match(label)
+            if match:
+                day = f"day{int(match.group(1)):02d}"
+                if match.group(2) == "parser":
+                    return day, "parse"
+                for inner in labels:
+                    if inner.endswith(":solve_part1"):
+                        return day, "part1"
+                    if inner.endswith(":solve_part2"):
+                        return day, "part2"
+                return day, "solve"
+        return "other", "other"
+
+    def collapsed(self) -> list[str]:
+        """Return samples as collapsed-stack lines prefixed by day and stage."""
+        lines = Counter()
+        for stack, count in self.samples.items():
+            labels = [self._labels[code] for code in stack]
+            day, stage = self._day_and_stage(labels)
+            lines[";".join([day, stage] + labels)] += count
+        return [f"{stack} {count}" for stack, count in sorted(lines.items())]
+
+    def stage_totals(self) -> dict[tuple[str, str], int]:
+        """Return the number of samples per (day, stage)."""
+        totals = Counter()
+        for stack, count in self.samples.items():
+            labels = [self._labels[code] for code in stack]
+            totals[self._day_and_stage(labels)] += count
+        return dict(sorted(totals.items()))
+
+    def write(self, path: str) -> None:
+        """Stop sampling, write collapsed stacks to path and a summary to stderr."""
+        self.stop()
+        with open(path, "w") as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+
+        total = sum(self.samples.values())
+        print(f"\nSampling profile: {total} samples written to {path}", file=sys.stderr)
+        for (day, stage), count in self.stage_totals().items():
+            print(f"  {day} {stage:<5} {count:>7} ({100 * count / total:.1f}%)", file=sys.stderr)
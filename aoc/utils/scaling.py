@@ -0,0 +1,370 @@
+"""Empirical scaling-curve report for every day's solver.
+
+Each day's parse, part 1 and part 2 stages are timed on generated inputs
+of geometrically increasing size, and a power law t = c * n^k is fitted
+to the timings. Stages whose measured exponent k exceeds the expected
+one by more than a tolerance are flagged.
+
+Run with:
+    python -m aoc.utils.scaling [--days 8 9] [--csv scaling.csv]
+"""
+import argparse
+import csv
+import gc
+import math
+import random
+import time
+from typing import Callable, NamedTuple
+
+from aoc.day01.parser import parse_rotations
+from aoc.day01.solver import solve_part1 as day01_part1, solve_part2 as day01_part2
+from aoc.day02.parser import parse_ranges
+from aoc.day02.solver import solve_part1 as day02_part1, solve_part2 as day02_part2
+from aoc.day03.parser import parse_banks
+from aoc.day03.solver import solve_part1 as day03_part1, solve_part2 as day03_part2
+from aoc.day04.parser import parse as parse_day04
+from aoc.day04.solver import solve_part1 as day04_part1, solve_part2 as day04_part2
+from aoc.day05.parser import parse_inventory
+from aoc.day05.solver import solve_part1 as day05_part1, solve_part2 as day05_part2
+from aoc.day06.parser import parse_worksheet, parse_worksheet_part2
+from aoc.day06.solver import solve_part1 as day06_part1, solve_part2 as day06_part2
+from aoc.day07.parser import parse_manifold
+from aoc.day07.solver import solve_part1 as day07_part1, solve_part2 as day07_part2
+from aoc.day08.parser import parse_junctions
+from aoc.day08.solver import solve_part1 as day08_part1, solve_part2 as day08_part2
+from aoc.day09.parser import parse_tiles
+from aoc.day09.solver import solve_part1 as day09_part1, solve_part2 as day09_part2
+from aoc.day10.parser import parse_input as parse_day10
+from aoc.day10.solver import solve_part1 as day10_part1, solve_part2 as day10_part2
+from aoc.day11.parser import parse_devices
+from aoc.day11.solver import solve_part1 as day11_part1, solve_part2 as day11_part2
+
+
+class Stage(NamedTuple):
+    """One timed stage of a day's pipeline."""
+
+    name: str  # 'parse', 'part1' or 'part2'
+    function: str  # Qualified name of the function being measured
+    run: Callable  # Called with the raw text (parse) or the parsed input
+    expected: float  # Expected exponent in terms of the size parameter
+
+
+class DaySpec(NamedTuple):
+    """How to generate, parse and solve one day at a given size."""
+
+    day: int
+    generate: Callable[[int, random.Random], str]
+    base_size: int
+    stages: list[Stage]
+
+
+class StageResult(NamedTuple):
+    """Timings and fitted exponent for one stage."""
+
+    day: int
+    stage: str
+    function: str
+    sizes: list[int]
+    seconds: list[float]
+    exponent: float
+    expected: float
+    flagged: bool
+
+
+def _qualname(func: Callable) -> str:
+    return f"{func.__module__}.{func.__name__}"
+
+
+def _stages(parse: Callable, part1: Callable, part2: Callable,
+            expected: tuple[float, float, float],
+            names: tuple[Callable, Callable, Callable] | None = None) -> list[Stage]:
+    """Build the standard parse/part1/part2 stages for a day.
+
+    When a stage is a lambda adapting the parsed input to a multi-argument
+    solver, `names` gives the underlying functions to report instead.
+    """
+    names = names or (parse, part1, part2)
+    return [
+        Stage("parse", _qualname(names[0]), parse, expected[0]),
+        Stage("part1", _qualname(names[1]), part1, expected[1]),
+        Stage("part2", _qualname(names[2]), part2, expected[2]),
+    ]
+
+
+# Input generators. Each takes a size parameter n and a seeded RNG and
+# returns puzzle text in the same format as the real inputs.
+
+def _generate_day01(n: int, rng: random.Random) -> str:
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(n))
+
+
+def _generate_day02(n: int, rng: random.Random) -> str:
+    ranges = []
+    for _ in range(n):
+        start = rng.randint(1, 10**9)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**4)}")
+    return ",".join(ranges)
+
+
+def _generate_day03(n: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join(rng.choice("123456789") for _ in range(100)) for _ in range(n)
+    )
+
+
+def _generate_day04(n: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join("@" if rng.random() < 0.6 else "." for _ in range(n)) for _ in range(n)
+    )
+
+
+def _generate_day05(n: int, rng: random.Random) -> str:
+    ranges = []
+    for _ in range(n):
+        start = rng.randint(1, 10**12)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**8)}")
+    ids = [str(rng.randint(1, 10**12)) for _ in range(n)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
+
+
+def _generate_day06(n: int, rng: random.Random) -> str:
+    # Every problem is 4 columns wide; the first number always has 4 digits
+    # so no column inside a problem is entirely blank.
+    rows = [[] for _ in range(4)]
+    operators = []
+    for _ in range(n):
+        rows[0].append(str(rng.randint(1000, 9999)))
+        for row in rows[1:]:
+            row.append(str(rng.randint(1, 9999)).ljust(4))
+        operators.append(rng.choice("+*").ljust(4))
+    return "\n".join(" ".join(row) for row in rows) + "\n" + " ".join(operators)
+
+
+def _generate_day07(n: int, rng: random.Random) -> str:
+    lines = ["." * (n // 2) + "S" + "." * (n - n // 2 - 1)]
+    for row in range(1, n):
+        if row % 2 == 0:
+            lines.append("".join("^" if rng.random() < 0.1 else "." for _ in range(n)))
+        else:
+            lines.append("." * n)
+    return "\n".join(lines)
+
+
+def _generate_day08(n: int, rng: random.Random) -> str:
+    return "\n".join(
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}"
+        for _ in range(n)
+    )
+
+
+def _generate_day09(n: int, rng: random.Random) -> str:
+    # A rectilinear staircase polygon with 2m + 2 vertices
+    m = max(1, (n - 2) // 2)
+    scale = 1000
+    points = [(0, 0), (0, m * scale)]
+    for i in range(1, m + 1):
+        points.append((i * scale, (m - i + 1) * scale))
+        points.append((i * scale, (m - i) * scale))
+    return "\n".join(f"{x},{y}" for x, y in points)
+
+
+def _generate_day10(n: int, rng: random.Random) -> str:
+    # Small machines built from random presses, so every one is solvable
+    lines = []
+    for _ in range(n):
+        # Fewer distinct buttons than lights keeps the solution space small
+        num_lights = 5
+        buttons = []
+        while len(buttons) < 4:
+            button = sorted(rng.sample(range(num_lights), rng.randint(1, num_lights)))
+            if button not in buttons:
+                buttons.append(button)
+        presses = [rng.randint(0, 3) for _ in buttons]
+        joltages = [
+            sum(p for p, button in zip(presses, buttons) if light in button)
+            for light in range(num_lights)
+        ]
+        diagram = "".join("#" if j % 2 else "." for j in joltages)
+        schematic = " ".join("(" + ",".join(map(str, b)) + ")" for b in buttons)
+        lines.append(f"[{diagram}] {schematic} {{{','.join(map(str, joltages))}}}")
+    return "\n".join(lines)
+
+
+def _generate_day11(n: int, rng: random.Random) -> str:
+    # A binary tree rooted at svr (kept shallow for the recursive solvers),
+    # with dac and fft on one branch and every leaf wired to out.
+    def name(i: int) -> str:
+        return {0: "svr", 1: "dac", 3: "fft"}.get(i, f"n{i}")
+
+    lines = ["you: dac n2"]
+    for i in range(n):
+        children = [name(c) for c in (2 * i + 1, 2 * i + 2) if c < n]
+        lines.append(f"{name(i)}: {' '.join(children) if children else 'out'}")
+    return "\n".join(lines)
+
+
+DAYS = [
+    DaySpec(1, _generate_day01, 20000,
+            _stages(parse_rotations, day01_part1, day01_part2, (1, 1, 1))),
+    DaySpec(2, _generate_day02, 2000,
+            _stages(parse_ranges, day02_part1, day02_part2, (1, 1, 1))),
+    DaySpec(3, _generate_day03, 500,
+            _stages(parse_banks, day03_part1, day03_part2, (1, 1, 1))),
+    DaySpec(4, _generate_day04, 40,
+            _stages(parse_day04, day04_part1, day04_part2, (2, 2, 2))),
+    DaySpec(5, _generate_day05, 500,
+            _stages(parse_inventory, lambda parsed: day05_part1(*parsed),
+                    lambda parsed: day05_part2(*parsed), (1, 1, 1),
+                    (parse_inventory, day05_part1, day05_part2))),
+    DaySpec(6, _generate_day06, 500,
+            _stages(lambda text: (parse_worksheet(text), parse_worksheet_part2(text)),
+                    lambda parsed: day06_part1(parsed[0]),
+                    lambda parsed: day06_part2(parsed[1]), (1, 1, 1),
+                    (parse_worksheet, day06_part1, day06_part2))),
+    DaySpec(7, _generate_day07, 60,
+            _stages(parse_manifold, lambda parsed: day07_part1(*parsed),
+                    lambda parsed: day07_part2(*parsed), (2, 2, 2),
+                    (parse_manifold, day07_part1, day07_part2))),
+    DaySpec(8, _generate_day08, 100,
+            _stages(parse_junctions, day08_part1, day08_part2, (1, 2, 2))),
+    DaySpec(9, _generate_day09, 20,
+            _stages(parse_tiles, day09_part1, day09_part2, (1, 2, 2))),
+    DaySpec(10, _generate_day10, 100,
+            _stages(parse_day10, day10_part1, day10_part2, (1, 1, 1))),
+    DaySpec(11, _generate_day11, 500,
+            _stages(parse_devices, day11_part1, day11_part2, (1, 1, 1))),
+]
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Least-squares slope of log(seconds) against log(size).
+
+    Args:
+        sizes: Input size parameters.
+        seconds: Measured times for each size.
+
+    Returns:
+        The fitted power-law exponent k in t = c * n^k.
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return 0.0
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return sxy / sxx
+
+
+def _time(func: Callable, arg, repeats: int) -> float:
+    # Like timeit, keep the garbage collector out of the measurement
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = math.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func(arg)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def measure_day(
+    spec: DaySpec,
+    points: int = 4,
+    scale: float = 1.0,
+    repeats: int = 5,
+    tolerance: float = 0.3,
+    seed: int = 2026,
+) -> list[StageResult]:
+    """Time every stage of one day over a doubling series of sizes.
+
+    Args:
+        spec: The day to measure.
+        points: Number of sizes; each is double the previous one.
+        scale: Multiplier applied to the day's base size.
+        repeats: Runs per size; the fastest is kept.
+        tolerance: How far above the expected exponent a stage may be
+                   before it is flagged.
+        seed: RNG seed for input generation.
+
+    Returns:
+        One StageResult per stage, in pipeline order.
+    """
+    rng = random.Random(seed)
+    base = max(2, int(spec.base_size * scale))
+    sizes = [base * 2**i for i in range(points)]
+    timings = {stage.name: [] for stage in spec.stages}
+
+    for n in sizes:
+        text = spec.generate(n, rng)
+        parse, part1, part2 = spec.stages
+        timings[parse.name].append(_time(parse.run, text, repeats))
+        parsed = parse.run(text)
+        timings[part1.name].append(_time(part1.run, parsed, repeats))
+        timings[part2.name].append(_time(part2.run, parsed, repeats))
+
+    results = []
+    for stage in spec.stages:
+        exponent = fit_exponent(sizes, timings[stage.name])
+        results.append(StageResult(
+            spec.day, stage.name, stage.function, sizes, timings[stage.name],
+            exponent, stage.expected, exponent > stage.expected + tolerance,
+        ))
+    return results
+
+
+def format_table(results: list[StageResult]) -> str:
+    """Render results as a fixed-width text table."""
+    header = f"{'Day':>3}  {'Stage':<6} {'Exponent':>8} {'Expected':>8}  {'':4} Function"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        flag = "SLOW" if r.flagged else ""
+        lines.append(
+            f"{r.day:>3}  {r.stage:<6} {r.exponent:>8.2f} {r.expected:>8.2f}  {flag:4} {r.function}"
+        )
+    return "\n".join(lines)
+
+
+def write_csv(results: list[StageResult], path: str) -> None:
+    """Write one row per stage, with sizes and timings ';'-joined."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["day", "stage", "function", "exponent", "expected",
+                         "flagged", "sizes", "seconds"])
+        for r in results:
+            writer.writerow([
+                r.day, r.stage, r.function, f"{r.exponent:.3f}", r.expected,
+                int(r.flagged), ";".join(map(str, r.sizes)),
+                ";".join(f"{t:.6g}" for t in r.seconds),
+            ])
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Empirical scaling report per solver.")
+    parser.add_argument("--days", type=int, nargs="*", help="Days to measure (default: all)")
+    parser.add_argument("--points", type=int, default=4, help="Number of input sizes")
+    parser.add_argument("--scale", type=float, default=1.0, help="Base size multiplier")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per size (fastest kept)")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="Allowed excess over the expected exponent")
+    parser.add_argument("--csv", default="scaling_report.csv", help="CSV output path")
+    args = parser.parse_args(argv)
+
+    results = []
+    for spec in DAYS:
+        if args.days and spec.day not in args.days:
+            continue
+        results.extend(measure_day(spec, args.points, args.scale, args.repeats, args.tolerance))
+
+    print(format_table(results))
+    write_csv(results, args.csv)
+    print(f"\nWrote {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Shared-memory distribution of parsed numeric inputs.
+
+Parsed inputs such as junction coordinates (day 8) or polygon vertices
+(day 9) are flat tables of integers. Instead of pickling them to every
+worker task, they are copied once into a `multiprocessing.shared_memory`
+block and each worker attaches to it and reads through a zero-copy
+memoryview.
+"""
+from array import array
+from multiprocessing import Pool, shared_memory
+from typing import Callable, Iterable, Sequence
+
+# (block name, typecode, number of rows, row width)
+SharedHandle = tuple[str, str, int, int]
+
+
+class SharedArray:
+    """A table of numbers stored once in shared memory.
+
+    Rows are stored flat in row-major order, so a list of (x, y, z)
+    tuples becomes a block of 3 * n values with width 3.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]] | Sequence[int], typecode: str = "q"):
+        """Copy rows into a new shared memory block.
+
+        Args:
+            rows: Either a flat sequence of numbers or a sequence of
+                  equal-length tuples (e.g. [(x, y, z), ...]).
+            typecode: `array` typecode of the stored values (default 'q',
+                      signed 64-bit).
+        """
+        if rows and not isinstance(rows[0], (int, float)):
+            width = len(rows[0])
+            flat = array(typecode, (value for row in rows for value in row))
+        else:
+            width = 1
+            flat = array(typecode, rows)
+
+        self.typecode = typecode
+        self.width = width
+        self.length = len(flat) // width if width else 0
+
+        # Zero-size blocks are not allowed, so always reserve one item
+        size = max(flat.itemsize * len(flat), flat.itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._view = self._shm.buf.cast(typecode)[: len(flat)]
+        self._view[:] = flat
+
+    @property
+    def handle(self) -> SharedHandle:
+        """Picklable description that workers pass to `attach`."""
+        return (self._shm.name, self.typecode, self.length, self.width)
+
+    def view(self) -> memoryview:
+        """Flat zero-copy view of the stored values."""
+        return self._view
+
+    def row(self, i: int) -> tuple:
+        """Return row i as a tuple."""
+        return tuple(self._view[i * self.width:(i + 1) * self.width])
+
+    def close(self) -> None:
+        """Release the view and free the shared memory block."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._shm.close()
+            self._shm.unlink()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def attach(handle: SharedHandle) -> tuple[shared_memory.SharedMemory, memoryview]:
+    """Attach to a block created by `SharedArray` from another process.
+
+    The returned SharedMemory object must be kept alive for as long as
+    the view is used, and the view released before closing it.
+
+    Args:
+        handle: Value of `SharedArray.handle`.
+
+    Returns:
+        Tuple of (SharedMemory, flat memoryview of the values).
+    """
+    name, typecode, length, width = handle
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast(typecode)[: length * width]
+    return shm, view
+
+
+# Per-worker state set up by _init_worker, so the block is attached once
+# per process rather than once per task.
+_worker_shm = None
+_worker_view = None
+_worker_width = 1
+_worker_func = None
+
+
+def _init_worker(handle: SharedHandle, func: Callable) -> None:
+    global _worker_shm, _worker_view, _worker_width, _worker_func
+    _worker_shm, _worker_view = attach(handle)
+    _worker_width = handle[3]
+    _worker_func = func
+
+
+def _run_task(task):
+    return _worker_func(_worker_view, _worker_width, task)
+
+
+def shared_map(
+    func: Callable,
+    shared: SharedArray,
+    tasks: Iterable,
+    processes: int | None = None,
+) -> list:
+    """Run func over tasks in a process pool, sharing the input table.
+
+    Only the tasks themselves (e.g. index ranges) are pickled; every
+    worker reads the table through its own zero-copy view.
+
+    Args:
+        func: Top-level function called as func(view, width, task), where
+              view is the flat memoryview and width the row width.
+        shared: Table to share with the workers.
+        tasks: Small picklable work descriptions.
+        processes: Number of worker processes (default: CPU count).
+
+    Returns:
+        List of func results, in task order.
+    """
+    with Pool(processes, initializer=_init_worker, initargs=(shared.handle, func)) as pool:
+        return pool.map(_run_task, tasks)
@@ -1,4 +1,8 @@
+import argparse
+import atexit
+
 from aoc.utils.input_reader import read_input
+from aoc.utils.sampling_profiler import SamplingProfiler
 from aoc.day01.parser import parse_rotations
 from aoc.day01.solver import solve_part1, solve_part2
 from aoc.day02.parser import parse_ranges
@@ -21,7 +25,19 @@ from aoc.day11.parser import parse_devices
 from aoc.day11.solver import solve_part1 as solve_day11_part1, solve_part2 as solve_day11_part2
 
 
-def main():
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Run all Advent of Code 2026 solutions.")
+    parser.add_argument("--sample-profile", metavar="PATH",
+                        help="Write collapsed stack samples to PATH at exit")
+    parser.add_argument("--sample-rate", type=float, default=100.0,
+                        help="Samples per second of CPU time (default: 100)")
+    args = parser.parse_args(argv)
+
+    if args.sample_profile:
+        profiler = SamplingProfiler(args.sample_rate)
+        atexit.register(profiler.write, args.sample_profile)
+        profiler.start()
+
     print("Advent of Code 2026")
     print("=" * 40)
 
@@ -1,7 +1,12 @@
+import io
 import unittest
 
-from aoc.day01.parser import parse_rotations
-from aoc.day01.solver import solve_part1, solve_part2
+from aoc.day01.parser import parse_rotations, parse_rotations_array, iter_rotations
+from aoc.day01 import parser, solver
+from aoc.day01.solver import (
+    solve_part1, solve_part2, signed_distances, solve_vectorised, solve_stream,
+    DialSegment, solve_parallel, DialLog, solve_all_starts,
+)
 
 
 EXAMPLE_INPUT = """L68
@@ -65,6 +70,161 @@ class TestDay01(unittest.TestCase):
         result = solve_part2(rotations)
         self.assertEqual(result, 3)
 
+    def test_vectorised_example(self):
+        rotations = parse_rotations(EXAMPLE_INPUT)
+        self.assertEqual(solve_vectorised(signed_distances(rotations)), (3, 6))
+
+    def test_vectorised_matches_loop_edge_cases(self):
+        # Left moves from 0, exact multiples of 100 and zero-length moves
+        cases = [
+            [("L", 50), ("L", 100)],
+            [("L", 50), ("L", 99)],
+            [("L", 50), ("L", 250), ("R", 0), ("L", 0)],
+            [("R", 50), ("R", 100), ("L", 1), ("R", 1)],
+            [("L", 1000), ("R", 1000), ("L", 51)],
+            [],
+        ]
+        for rotations in cases:
+            expected = (solve_part1(rotations), solve_part2(rotations))
+            self.assertEqual(solve_vectorised(signed_distances(rotations)), expected)
+
+    def test_vectorised_without_numpy(self):
+        rotations = parse_rotations(EXAMPLE_INPUT) + [("L", 32), ("L", 300)]
+        expected = (solve_part1(rotations), solve_part2(rotations))
+        numpy, solver.np = solver.np, None
+        try:
+            self.assertEqual(solve_vectorised(signed_distances(rotations)), expected)
+        finally:
+            solver.np = numpy
+
+    def test_iter_rotations_matches_parser(self):
+        # Chunks that split lines anywhere must parse the same as the full text
+        data = EXAMPLE_INPUT.encode()
+        chunks = [data[i:i + 3] for i in range(0, len(data), 3)]
+        self.assertEqual(list(iter_rotations(chunks)), parse_rotations(EXAMPLE_INPUT))
+
+    def test_solve_stream_text_file(self):
+        self.assertEqual(solve_stream(io.StringIO(EXAMPLE_INPUT + "\n\n")), (3, 6))
+
+    def test_solve_stream_binary_file(self):
+        self.assertEqual(solve_stream(io.BytesIO(EXAMPLE_INPUT.encode())), (3, 6))
+
+    def test_dial_segment_all_starts(self):
+        rotations = parse_rotations(EXAMPLE_INPUT)
+        segment = DialSegment.from_rotations(rotations)
+        self.assertEqual(segment.answers(), (3, 6))
+        self.assertEqual(segment.end[50], 32)
+        # Other start positions: prefix a move from 50 to the start and run
+        # the loop solvers; that move only touches 0 when the start is 0
+        for start in (0, 1, 31, 68, 99):
+            prefix = [("R", start - 50)] if start >= 50 else [("L", 50 - start)]
+            self.assertEqual(segment.end[start], (start - 18) % 100)
+            self.assertEqual(segment.landings[start],
+                             solve_part1(prefix + rotations) - (start == 0))
+            self.assertEqual(segment.crossings[start],
+                             solve_part2(prefix + rotations) - (start == 0))
+
+    def test_dial_segment_combine_is_associative(self):
+        rotations = parse_rotations(EXAMPLE_INPUT) + [("L", 250), ("R", 1000), ("L", 0)]
+        a = DialSegment.from_rotations(rotations[:4])
+        b = DialSegment.from_rotations(rotations[4:9])
+        c = DialSegment.from_rotations(rotations[9:])
+        left = a.combine(b).combine(c)
+        right = a.combine(b.combine(c))
+        whole = DialSegment.from_rotations(rotations)
+        for segment in (left, right):
+            self.assertEqual(segment.end, whole.end)
+            self.assertEqual(segment.landings, whole.landings)
+            self.assertEqual(segment.crossings, whole.crossings)
+        self.assertEqual(whole.answers(), (solve_part1(rotations), solve_part2(rotations)))
+
+    def test_solve_parallel(self):
+        rotations = parse_rotations(EXAMPLE_INPUT) * 7
+        expected = (solve_part1(rotations), solve_part2(rotations))
+        self.assertEqual(solve_parallel(rotations, chunk_size=4, processes=2), expected)
+
+    def test_dial_log_answers(self):
+        rotations = parse_rotations(EXAMPLE_INPUT)
+        log = DialLog(rotations)
+        self.assertEqual(len(log), 10)
+        self.assertEqual(log.answers(), (3, 6))
+        self.assertEqual(log.answers(2, 7), (solve_part1(rotations[2:7]), solve_part2(rotations[2:7])))
+
+    def test_dial_log_edits(self):
+        rotations = parse_rotations(EXAMPLE_INPUT)
+        log = DialLog(rotations)
+
+        rotations[3] = ("R", 250)
+        log.update(3, "R", 250)
+        rotations.insert(0, ("L", 50))
+        log.insert(0, "L", 50)
+        rotations.insert(6, ("L", 100))
+        log.insert(6, "L", 100)
+        rotations.append(("R", 32))
+        log.append("R", 32)
+        del rotations[2]
+        log.delete(2)
+
+        self.assertEqual(len(log), len(rotations))
+        for start, stop in [(0, None), (1, 5), (4, 12), (3, 3)]:
+            expected_range = rotations[start:stop]
+            expected = (solve_part1(expected_range), solve_part2(expected_range))
+            self.assertEqual(log.answers(start, stop), expected)
+
+    def test_dial_log_empty(self):
+        log = DialLog()
+        self.assertEqual(log.answers(), (0, 0))
+        log.append("L", 50)
+        self.assertEqual(log.answers(), (1, 1))
+        with self.assertRaises(IndexError):
+            log.update(1, "R", 1)
+
+    def test_start_and_modulus_parameters(self):
+        rotations = [("L", 3), ("R", 10), ("L", 7)]
+        # Dial 0-6 starting at 3: positions 0, 3, 3; crossings 1, 1, 1
+        self.assertEqual(solve_part1(rotations, start=3, modulus=7), 1)
+        self.assertEqual(solve_part2(rotations, start=3, modulus=7), 3)
+
+    def test_solve_all_starts(self):
+        rotations = parse_rotations(EXAMPLE_INPUT) + [("L", 23), ("R", 130)]
+        for modulus in (100, 7, 360):
+            part1, part2 = solve_all_starts(rotations, modulus)
+            self.assertEqual(len(part1), modulus)
+            for start in range(modulus):
+                self.assertEqual(part1[start], solve_part1(rotations, start, modulus))
+                self.assertEqual(part2[start], solve_part2(rotations, start, modulus))
+
+    def test_parse_rotations_array(self):
+        distances = parse_rotations_array(EXAMPLE_INPUT + "\n")
+        self.assertEqual(distances.typecode, "q")
+        self.assertEqual(list(distances[:3]), [-68, -30, 48])
+        self.assertEqual(list(distances), signed_distances(parse_rotations(EXAMPLE_INPUT)))
+
+    def test_parse_rotations_array_chunks(self):
+        # Chunk boundaries must fall between lines, including lines longer
+        # than a chunk and input without a trailing newline
+        text = "L68\nR1234567890\n\nL5\r\nR48"
+        expected = signed_distances(parse_rotations(text))
+        original = parser._ARRAY_CHUNK
+        try:
+            for chunk in (1, 3, 4, 7, 100):
+                parser._ARRAY_CHUNK = chunk
+                self.assertEqual(list(parse_rotations_array(text)), expected)
+        finally:
+            parser._ARRAY_CHUNK = original
+
+    def test_solvers_accept_array(self):
+        distances = parse_rotations_array(EXAMPLE_INPUT)
+        self.assertEqual(solve_part1(distances), 3)
+        self.assertEqual(solve_part2(distances), 6)
+        self.assertEqual(solve_vectorised(distances), (3, 6))
+
+    def test_array_left_from_zero(self):
+        rotations = [("L", 50), ("L", 100), ("L", 250), ("R", 0), ("L", 0), ("R", 100)]
+        distances = parse_rotations_array("\n".join(f"{d}{n}" for d, n in rotations))
+        self.assertEqual(solve_part1(distances), solve_part1(rotations))
+        self.assertEqual(solve_part2(distances), solve_part2(rotations))
+
 
 if __name__ == "__main__":
     unittest.main()
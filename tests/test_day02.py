@@ -1,9 +1,14 @@
+import itertools
 import unittest
 
 from aoc.day02.parser import parse_ranges
 from aoc.day02.solver import (
     is_invalid_id, find_invalid_in_range, solve_part1,
-    is_invalid_id_part2, find_invalid_in_range_part2, solve_part2
+    is_invalid_id_part2, find_invalid_in_range_part2, solve_part2,
+    find_invalid_sum_in_range_part2_closed_form, InvalidIdIndex,
+    iter_invalid_in_range, iter_invalid_in_range_part2,
+    count_invalid_in_range, select_invalid,
+    find_repeated_sum_in_range, solve_repeated, EXACTLY_TWICE, AT_LEAST_TWICE,
 )
 
 
@@ -116,6 +121,106 @@ class TestDay02(unittest.TestCase):
         result = solve_part2(ranges)
         self.assertEqual(result, 4174379265)
 
+    def test_closed_form_part2_matches_enumeration(self):
+        for start, end in [(1, 10**6), (95, 115), (998, 1012), (111110, 111112),
+                           (2121212118, 2121212124), (10**11, 10**11 + 10**5)]:
+            expected = sum(find_invalid_in_range_part2(start, end))
+            self.assertEqual(find_invalid_sum_in_range_part2_closed_form(start, end), expected)
+
+    def test_closed_form_part2_wide_range(self):
+        # Every 10-digit number repeated at least twice, counted once each
+        expected = sum(find_invalid_in_range_part2(10**9, 10**10 - 1))
+        self.assertEqual(find_invalid_sum_in_range_part2_closed_form(10**9, 10**10 - 1), expected)
+
+    def test_index_prefix(self):
+        index = InvalidIdIndex()
+        self.assertEqual(index.prefix(0), (0, 0))
+        self.assertEqual(index.prefix(22), (2, 33))
+        self.assertEqual(index.prefix(111, part=2), (10, 11 + 22 + 33 + 44 + 55 + 66 + 77 + 88 + 99 + 111))
+
+    def test_index_matches_solvers(self):
+        ranges = parse_ranges(EXAMPLE_INPUT)
+        index = InvalidIdIndex()
+        self.assertEqual(index.total(ranges, part=1), 1227775554)
+        self.assertEqual(index.total(ranges, part=2), 4174379265)
+
+    def test_index_batch(self):
+        ranges = sorted(parse_ranges(EXAMPLE_INPUT))
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+        index = InvalidIdIndex()
+        for part in (1, 2):
+            expected = [index.range_sum(start, end, part) for start, end in ranges]
+            self.assertEqual(index.batch_range_sums(starts, ends, part), expected)
+
+    def test_index_too_many_digits(self):
+        with self.assertRaises(ValueError):
+            InvalidIdIndex(max_digits=6).prefix(10**6)
+
+    def test_iter_invalid_in_range(self):
+        self.assertEqual(list(iter_invalid_in_range(11, 22)), [11, 22])
+        self.assertEqual(list(iter_invalid_in_range(95, 1012)), sorted(find_invalid_in_range(95, 1012)))
+
+    def test_iter_invalid_in_range_part2(self):
+        self.assertEqual(list(iter_invalid_in_range_part2(95, 115)), [99, 111])
+        expected = sorted(find_invalid_in_range_part2(1, 2 * 10**6))
+        self.assertEqual(list(iter_invalid_in_range_part2(1, 2 * 10**6)), expected)
+
+    def test_iter_invalid_part2_deduplicates(self):
+        # 111111 matches the 1-, 2- and 3-digit patterns but appears once
+        self.assertEqual(list(iter_invalid_in_range_part2(111110, 111112)), [111111])
+
+    def test_iter_invalid_is_lazy(self):
+        first = list(itertools.islice(iter_invalid_in_range_part2(10**17, 10**18 - 1), 3))
+        self.assertEqual(first, [100000000100000000, 100000001100000001, 100000002100000002])
+
+    def test_count_invalid_in_range(self):
+        self.assertEqual(count_invalid_in_range(11, 22), 2)
+        self.assertEqual(count_invalid_in_range(95, 115, part=2), 2)
+        self.assertEqual(count_invalid_in_range(1, 10**6, part=2),
+                         len(find_invalid_in_range_part2(1, 10**6)))
+
+    def test_count_invalid_near_limit(self):
+        # 10-digit halves: every 20-digit base * (10^10 + 1)
+        self.assertEqual(count_invalid_in_range(10**19, 10**20 - 1), 9 * 10**9)
+
+    def test_select_invalid(self):
+        self.assertEqual(select_invalid(95, 1), 99)
+        self.assertEqual(select_invalid(95, 2), 1010)
+        self.assertEqual(select_invalid(95, 2, part=2), 111)
+        self.assertEqual(select_invalid(111111, 1, part=2), 111111)
+        self.assertEqual(select_invalid(111111, 2, part=2), 112112)
+
+    def test_select_matches_generator(self):
+        for start in (1, 998, 565653, 2121212118):
+            for part, generator in ((1, iter_invalid_in_range), (2, iter_invalid_in_range_part2)):
+                expected = list(itertools.islice(generator(start, 10**12), 25))
+                self.assertEqual([select_invalid(start, k, part) for k in range(1, 26)], expected)
+
+    def test_select_beyond_limit(self):
+        self.assertIsNone(select_invalid(10**19, 10**10))
+
+    def test_repeated_engine_matches_parts(self):
+        ranges = parse_ranges(EXAMPLE_INPUT)
+        self.assertEqual(solve_repeated(ranges, EXACTLY_TWICE), 1227775554)
+        self.assertEqual(solve_repeated(ranges, AT_LEAST_TWICE), 4174379265)
+
+    def test_repeated_engine_exactly_three(self):
+        # 3-, 6- and 9-digit numbers made of a unit repeated three times
+        expected = sum(n for n in range(1, 10**6) if len(str(n)) % 3 == 0
+                       and str(n) == str(n)[:len(str(n)) // 3] * 3)
+        self.assertEqual(find_repeated_sum_in_range(1, 10**6, frozenset({3})), expected)
+
+    def test_repeated_engine_radix(self):
+        # Binary: 0b1010 (10), 0b1111 (15), 0b11 (3), 0b111 (7) repeat a unit
+        def is_repeated(n):
+            s = bin(n)[2:]
+            return any(len(s) % r == 0 and s == s[:len(s) // r] * r for r in range(2, len(s) + 1))
+
+        expected = sum(n for n in range(1, 5000) if is_repeated(n))
+        self.assertEqual(find_repeated_sum_in_range(1, 4999, AT_LEAST_TWICE, radix=2), expected)
+        self.assertEqual(find_repeated_sum_in_range(1, 15, EXACTLY_TWICE, radix=2), 3 + 10 + 15)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,13 @@
+import io
 import unittest
 
+from aoc.day03 import solver
 from aoc.day03.parser import parse_banks
-from aoc.day03.solver import max_joltage, solve_part1, max_joltage_k, solve_part2
+from aoc.day03.solver import (
+    max_joltage, solve_part1, max_joltage_k, solve_part2, BankIndex,
+    max_joltage_all_k, solve_part1_bytes, max_joltage_rows, solve_stream,
+    MutableBank,
+)
 
 
 EXAMPLE_INPUT = """987654321111111
@@ -68,6 +74,85 @@ class TestDay03(unittest.TestCase):
         result = solve_part2(banks)
         self.assertEqual(result, 3121910778619)
 
+    def test_bank_index_matches_max_joltage_k(self):
+        for bank in parse_banks(EXAMPLE_INPUT) + ["5", "1000", "9090909"]:
+            index = BankIndex(bank)
+            for k in range(0, len(bank) + 2):
+                self.assertEqual(index.max_joltage_k(k), max_joltage_k(bank, k))
+
+    def test_bank_index_many(self):
+        index = BankIndex("818181911112111")
+        self.assertEqual(index.max_joltage_many([2, 12]), [92, 888911112111])
+
+    def test_max_joltage_all_k(self):
+        bank = "818181911112111"
+        result = max_joltage_all_k(bank)
+        self.assertEqual(len(result), len(bank))
+        self.assertEqual(result[0], "9")
+        self.assertEqual(result[1], "92")
+        self.assertEqual(result[11], "888911112111")
+        self.assertEqual(result[-1], bank)
+
+    def test_max_joltage_all_k_matches_per_k(self):
+        for bank in parse_banks(EXAMPLE_INPUT) + ["1", "10", "0123456789", "5555"]:
+            expected = [max_joltage_k(bank, k) for k in range(1, len(bank) + 1)]
+            self.assertEqual(max_joltage_all_k(bank, as_int=True), expected)
+
+    def test_solve_part1_bytes(self):
+        self.assertEqual(solve_part1_bytes(EXAMPLE_INPUT.encode()), 357)
+        self.assertEqual(solve_part1_bytes((EXAMPLE_INPUT + "\r\n").encode()), 357)
+
+    def test_solve_part1_bytes_uneven_banks(self):
+        banks = ["5", "19", "01", "818181911112111", "987"]
+        data = "\n".join(banks).encode()
+        self.assertEqual(solve_part1_bytes(data), solve_part1(banks))
+
+    def test_solve_part1_bytes_without_numpy(self):
+        banks = parse_banks(EXAMPLE_INPUT) + ["5", "19"]
+        numpy, solver.np = solver.np, None
+        try:
+            self.assertEqual(solve_part1_bytes("\n".join(banks).encode()), solve_part1(banks))
+        finally:
+            solver.np = numpy
+
+    @unittest.skipIf(solver.np is None, "NumPy not installed")
+    def test_max_joltage_rows(self):
+        digits = solver.np.array([[9, 8, 7], [1, 1, 9], [8, 1, 9]], dtype=solver.np.uint8)
+        self.assertEqual(max_joltage_rows(digits).tolist(), [98, 19, 89])
+
+    def test_solve_stream_text(self):
+        source = io.StringIO(EXAMPLE_INPUT + "\n\n")
+        self.assertEqual(solve_stream(source, chunk_size=1, processes=2), (357, 3121910778619))
+
+    def test_solve_stream_binary(self):
+        source = io.BytesIO(((EXAMPLE_INPUT + "\n") * 5).encode())
+        self.assertEqual(solve_stream(source, chunk_size=3, processes=1), (5 * 357, 5 * 3121910778619))
+
+    def test_mutable_bank_initial(self):
+        for bank in parse_banks(EXAMPLE_INPUT):
+            mutable = MutableBank(bank)
+            self.assertEqual(mutable.max_joltage(), max_joltage(bank))
+            self.assertEqual(mutable.max_joltage_k(12), max_joltage_k(bank, 12))
+
+    def test_mutable_bank_updates(self):
+        bank = list("234234234234278")
+        mutable = MutableBank("".join(bank))
+        for position, digit in [(0, 9), (14, 1), (5, 9), (0, 1), (13, 0)]:
+            bank[position] = str(digit)
+            mutable.update(position, digit)
+            current = "".join(bank)
+            self.assertEqual(str(mutable), current)
+            self.assertEqual(mutable.max_joltage(), max_joltage(current))
+            for k in (1, 2, 5, 12, 15):
+                self.assertEqual(mutable.max_joltage_k(k), max_joltage_k(current, k))
+
+    def test_mutable_bank_short(self):
+        mutable = MutableBank("7")
+        self.assertEqual(mutable.max_joltage(), 0)
+        self.assertEqual(mutable.max_joltage_k(1), 7)
+        with self.assertRaises(IndexError):
+            mutable.update(1, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
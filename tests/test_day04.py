@@ -1,7 +1,14 @@
+import random
 import unittest
 
+from aoc.day04 import solver
 from aoc.day04.parser import parse
-from aoc.day04.solver import count_adjacent_rolls, solve_part1, solve_part2
+from aoc.day04.solver import (
+    count_adjacent_rolls, solve_part1, solve_part2,
+    to_bitboard, accessible_bitboard, solve_part1_bitboard, solve_part2_bitboard,
+    solve_part1_numpy, solve_part2_numpy,
+    to_flat, flat_neighbour_counts, solve_part2_flat, RemovalIndex, RollFloor,
+)
 
 
 EXAMPLE_INPUT = """..@@.@@@@.
@@ -49,6 +56,172 @@ class TestDay04(unittest.TestCase):
         result = solve_part2(grid)
         self.assertEqual(result, 43)
 
+    def test_to_bitboard(self):
+        self.assertEqual(to_bitboard(["@..@", "...."]), [0b1001, 0])
+        self.assertEqual(to_bitboard([".@@"]), [0b110])
+
+    def test_accessible_bitboard(self):
+        grid = parse(EXAMPLE_INPUT)
+        masks = accessible_bitboard(to_bitboard(grid))
+        for r, row in enumerate(grid):
+            for c, cell in enumerate(row):
+                expected = cell == '@' and count_adjacent_rolls(grid, r, c) < 4
+                self.assertEqual(bool(masks[r] >> c & 1), expected)
+
+    def test_bitboard_example(self):
+        grid = parse(EXAMPLE_INPUT)
+        self.assertEqual(solve_part1_bitboard(grid), 13)
+        self.assertEqual(solve_part2_bitboard(grid), 43)
+
+    def test_bitboard_dense_block(self):
+        # Interior of a full block has 8 neighbours; only corners are accessible
+        grid = ["@" * 5] * 5
+        self.assertEqual(solve_part1_bitboard(grid), solve_part1(grid))
+        self.assertEqual(solve_part2_bitboard(grid), solve_part2(grid))
+
+    def test_numpy_example(self):
+        grid = parse(EXAMPLE_INPUT)
+        self.assertEqual(solve_part1_numpy(grid), 13)
+        self.assertEqual(solve_part2_numpy(grid), 43)
+
+    @unittest.skipIf(solver.np is None, "NumPy not installed")
+    def test_neighbour_counts(self):
+        grid = parse(EXAMPLE_INPUT)
+        counts = solver.neighbour_counts(solver.to_array(grid))
+        for r, row in enumerate(grid):
+            for c in range(len(row)):
+                self.assertEqual(counts[r + 1, c + 1], count_adjacent_rolls(grid, r, c))
+
+    def test_numpy_edge_grids(self):
+        for grid in (["@"], ["@@@@@"], ["@"] * 4, ["@" * 6] * 6, ["...", ".@.", "..."]):
+            self.assertEqual(solve_part1_numpy(grid), solve_part1(grid))
+            self.assertEqual(solve_part2_numpy(grid), solve_part2(grid))
+
+    def test_to_flat(self):
+        cells, width = to_flat(["@.", ".@"])
+        self.assertEqual(width, 4)
+        self.assertEqual(cells, bytearray(b"\0\0\0\0\0\1\0\0\0\0\1\0\0\0\0\0"))
+
+    def test_flat_neighbour_counts(self):
+        grid = parse(EXAMPLE_INPUT)
+        cells, width = to_flat(grid)
+        counts = flat_neighbour_counts(cells, width)
+        for r, row in enumerate(grid):
+            for c in range(len(row)):
+                self.assertEqual(counts[(r + 1) * width + c + 1], count_adjacent_rolls(grid, r, c))
+
+    def test_flat_part2(self):
+        self.assertEqual(solve_part2_flat(parse(EXAMPLE_INPUT)), 43)
+        for grid in (["@"], ["@" * 6] * 6, ["..."]):
+            self.assertEqual(solve_part2_flat(grid), solve_part2(grid))
+
+    def test_removal_index_example(self):
+        index = RemovalIndex(parse(EXAMPLE_INPUT))
+        self.assertEqual(index.removed_after(0), 0)
+        self.assertEqual(index.removed_after(1), 13)
+        self.assertEqual(index.total(), 43)
+        self.assertEqual(index.removed_after(100), 43)
+        self.assertEqual(index.removed_in_round(2), 12)
+        self.assertEqual(index.round_of(0, 2), 1)
+        self.assertEqual(index.round_of(0, 0), 0)
+
+    def test_removal_index_thresholds(self):
+        grid = parse(EXAMPLE_INPUT)
+        index = RemovalIndex(grid)
+        rolls = sum(row.count('@') for row in grid)
+        totals = [index.total(t) for t in RemovalIndex.THRESHOLDS]
+        self.assertEqual(totals, sorted(totals))
+        self.assertEqual(index.total(1), 0)  # no roll is isolated
+        self.assertEqual(index.total(8), rolls)
+        # Round 1 at any threshold is part 1 with that threshold
+        for t in RemovalIndex.THRESHOLDS:
+            expected = sum(
+                1 for r, row in enumerate(grid) for c, cell in enumerate(row)
+                if cell == '@' and count_adjacent_rolls(grid, r, c) < t
+            )
+            self.assertEqual(index.removed_after(1, t), expected)
+
+    def test_removal_index_rounds(self):
+        # A 3x3 block peels corners, then edges, then the centre
+        index = RemovalIndex(["@@@", "@@@", "@@@"])
+        self.assertEqual(index.num_rounds(), 3)
+        self.assertEqual([index.removed_in_round(r) for r in (1, 2, 3)], [4, 4, 1])
+        self.assertEqual(index.round_of(0, 1), 2)
+        self.assertEqual(index.round_of(1, 1), 3)
+
+    def test_removal_index_invalid_queries(self):
+        index = RemovalIndex(parse(EXAMPLE_INPUT))
+        with self.assertRaises(ValueError):
+            index.removed_after(-1)
+        with self.assertRaises(ValueError):
+            index.removed_in_round(0)
+        for threshold in (0, 9):
+            with self.assertRaises(ValueError):
+                index.total(threshold)
+            with self.assertRaises(ValueError):
+                index.round_of(0, 2, threshold)
+
+    def test_roll_floor_initial(self):
+        grid = parse(EXAMPLE_INPUT)
+        floor = RollFloor(grid)
+        self.assertEqual(floor.grid(), grid)
+        self.assertEqual(floor.accessible(), 13)
+        self.assertEqual(floor.removable(), 43)
+
+    def test_roll_floor_updates(self):
+        grid = parse(EXAMPLE_INPUT)
+        floor = RollFloor(grid)
+        changes = [(0, 0), (0, 2), (4, 4), (9, 9), (5, 5), (0, 0), (1, 5), (3, 6), (9, 1)]
+        for row, col in changes:
+            if (row, col) in floor:
+                floor.remove(row, col)
+            else:
+                floor.add(row, col)
+            current = floor.grid()
+            self.assertEqual(floor.accessible(), solve_part1(current))
+            self.assertEqual(floor.removable(), solve_part2(current))
+
+    def test_roll_floor_grows_core(self):
+        # Fill an empty floor cell by cell; the core appears part way through
+        floor = RollFloor(["." * 5] * 5)
+        for row in range(5):
+            for col in range(5):
+                floor.add(row, col)
+                current = floor.grid()
+                self.assertEqual(floor.accessible(), solve_part1(current))
+                self.assertEqual(floor.removable(), solve_part2(current))
+
+    def test_roll_floor_add_is_local(self):
+        # The traversal for an add stays far smaller than the floor, unlike
+        # a flood of the non-core rolls (about 50k here)
+        class CountingFloor(RollFloor):
+            def _grow_core(self, cell):
+                visited = super()._grow_core(cell)
+                self.visits.append(visited)
+                return visited
+
+        rng = random.Random(4)
+        grid = ["".join("@" if rng.random() < 0.6 else "." for _ in range(300)) for _ in range(300)]
+        floor = CountingFloor(grid)
+        floor.visits = []
+        empty = [(r, c) for r, row in enumerate(grid) for c, cell in enumerate(row) if cell == '.']
+        for row, col in rng.sample(empty, 200):
+            floor.add(row, col)
+
+        rolls = sum(row.count('@') for row in floor.grid())
+        self.assertEqual(floor.removable(), solve_part2_flat(floor.grid()))
+        self.assertLess(max(floor.visits), rolls // 20)
+        self.assertLess(sum(floor.visits) // len(floor.visits), rolls // 100)
+
+    def test_roll_floor_errors(self):
+        floor = RollFloor(["@."])
+        with self.assertRaises(ValueError):
+            floor.add(0, 0)
+        with self.assertRaises(ValueError):
+            floor.remove(0, 1)
+        with self.assertRaises(IndexError):
+            floor.add(1, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
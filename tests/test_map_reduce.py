@@ -0,0 +1,59 @@
+import unittest
+from operator import add
+
+from aoc.day02.parser import parse_ranges
+from aoc.day02.solver import PART1_JOB as DAY02_JOB, solve_part1 as day02_part1
+from aoc.day03.parser import parse_banks
+from aoc.day03.solver import PART1_JOB as DAY03_JOB, solve_part1 as day03_part1
+from aoc.day05.parser import parse_inventory
+from aoc.day05.solver import PART1_JOB as DAY05_JOB, solve_part1 as day05_part1
+from aoc.day06.parser import parse_worksheet
+from aoc.day06.solver import PART1_JOB as DAY06_JOB, solve_part1 as day06_part1
+from aoc.utils.map_reduce import LocalNode, MapReduceJob, run_map_reduce
+from tests import test_day02, test_day03, test_day05, test_day06
+
+
+def _split_list(values):
+    return values, None
+
+
+def _square(record, context):
+    return record * record
+
+
+class TestMapReduce(unittest.TestCase):
+    def test_generic_job(self):
+        job = MapReduceJob(_split_list, _square, add)
+        self.assertEqual(run_map_reduce(job, list(range(100)), shard_size=7),
+                         sum(x * x for x in range(100)))
+
+    def test_empty_input(self):
+        job = MapReduceJob(_split_list, _square, add)
+        self.assertEqual(run_map_reduce(job, []), 0)
+
+    def test_multiple_nodes(self):
+        job = MapReduceJob(_split_list, _square, add)
+        with LocalNode(1) as first, LocalNode(1) as second:
+            result = run_map_reduce(job, list(range(50)), shard_size=5, nodes=[first, second])
+        self.assertEqual(result, sum(x * x for x in range(50)))
+
+    def test_day02_part1(self):
+        ranges = parse_ranges(test_day02.EXAMPLE_INPUT)
+        self.assertEqual(run_map_reduce(DAY02_JOB, ranges, shard_size=3), day02_part1(ranges))
+
+    def test_day03_part1(self):
+        banks = parse_banks(test_day03.EXAMPLE_INPUT)
+        self.assertEqual(run_map_reduce(DAY03_JOB, banks, shard_size=1), day03_part1(banks))
+
+    def test_day05_part1(self):
+        inventory = parse_inventory(test_day05.EXAMPLE_INPUT)
+        self.assertEqual(run_map_reduce(DAY05_JOB, inventory, shard_size=2),
+                         day05_part1(*inventory))
+
+    def test_day06_part1(self):
+        problems = parse_worksheet(test_day06.EXAMPLE_INPUT)
+        self.assertEqual(run_map_reduce(DAY06_JOB, problems, shard_size=1), day06_part1(problems))
+
+
+if __name__ == "__main__":
+    unittest.main()
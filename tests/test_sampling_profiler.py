@@ -0,0 +1,49 @@
+import os
+import tempfile
+import time
+import unittest
+
+from aoc.day09.solver import solve_part1
+from aoc.utils.sampling_profiler import SamplingProfiler
+
+
+def _busy(seconds: float) -> None:
+    tiles = [(x * 7 % 101, x * 13 % 97) for x in range(150)]
+    deadline = time.process_time() + seconds
+    while time.process_time() < deadline:
+        solve_part1(tiles)
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def test_samples_attributed_to_day_and_stage(self):
+        with SamplingProfiler(rate=1000) as profiler:
+            _busy(0.2)
+        totals = profiler.stage_totals()
+        self.assertGreater(totals.get(("day09", "part1"), 0), 0)
+
+    def test_collapsed_output(self):
+        profiler = SamplingProfiler(rate=1000)
+        profiler.start()
+        _busy(0.1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "samples.txt")
+            profiler.write(path)
+            with open(path) as f:
+                lines = f.read().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            self.assertGreater(int(count), 0)
+            self.assertEqual(len(stack.split(";")[:2]), 2)
+        self.assertTrue(any("aoc.day09.solver:solve_part1" in line for line in lines))
+
+    def test_stop_is_idempotent(self):
+        profiler = SamplingProfiler()
+        profiler.stop()
+        profiler.start()
+        profiler.stop()
+        profiler.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
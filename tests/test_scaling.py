@@ -0,0 +1,33 @@
+import random
+import unittest
+
+from aoc.utils.scaling import DAYS, fit_exponent, format_table, measure_day
+
+
+class TestScaling(unittest.TestCase):
+    def test_fit_exponent_linear(self):
+        sizes = [10, 20, 40, 80]
+        self.assertAlmostEqual(fit_exponent(sizes, [n * 1e-6 for n in sizes]), 1.0)
+
+    def test_fit_exponent_cubic(self):
+        sizes = [10, 20, 40, 80]
+        self.assertAlmostEqual(fit_exponent(sizes, [n**3 * 1e-9 for n in sizes]), 3.0)
+
+    def test_generated_inputs_solve(self):
+        # Every generator must produce input its day can parse and solve
+        for spec in DAYS:
+            text = spec.generate(8, random.Random(0))
+            parse, part1, part2 = spec.stages
+            parsed = parse.run(text)
+            part1.run(parsed)
+            part2.run(parsed)
+
+    def test_measure_day_reports_every_stage(self):
+        results = measure_day(DAYS[0], points=2, scale=0.01, repeats=1)
+        self.assertEqual([r.stage for r in results], ["parse", "part1", "part2"])
+        self.assertEqual(results[0].function, "aoc.day01.parser.parse_rotations")
+        self.assertIn("aoc.day01.solver.solve_part2", format_table(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from aoc.utils.shared_memory import SharedArray, attach, shared_map
+
+
+def _sum_first_column(view, width, task):
+    lo, hi = task
+    return sum(view[i * width] for i in range(lo, hi))
+
+
+class TestSharedArray(unittest.TestCase):
+    def test_rows_round_trip(self):
+        junctions = [(162, 817, 812), (57, 618, 57), (906, 360, 560)]
+        with SharedArray(junctions) as shared:
+            self.assertEqual(len(shared), 3)
+            self.assertEqual(shared.width, 3)
+            self.assertEqual(shared.row(1), (57, 618, 57))
+
+    def test_flat_values(self):
+        with SharedArray([5, -3, 7]) as shared:
+            self.assertEqual(shared.width, 1)
+            self.assertEqual(list(shared.view()), [5, -3, 7])
+
+    def test_attach_sees_same_data(self):
+        with SharedArray([(1, 2), (3, 4)]) as shared:
+            shm, view = attach(shared.handle)
+            self.assertEqual(list(view), [1, 2, 3, 4])
+            view.release()
+            shm.close()
+
+    def test_empty(self):
+        with SharedArray([]) as shared:
+            self.assertEqual(len(shared), 0)
+
+    def test_shared_map(self):
+        tiles = [(x, x + 1) for x in range(100)]
+        with SharedArray(tiles) as shared:
+            results = shared_map(_sum_first_column, shared, [(0, 50), (50, 100)], processes=2)
+        self.assertEqual(results, [sum(range(50)), sum(range(50, 100))])
+
+
+if __name__ == "__main__":
+    unittest.main()